@@ -0,0 +1,65 @@
+"""documents_tenant_uploader_status_index
+
+Revision ID: 0b9d4e6f2a71
+Revises: f5a0b8c3e7d2
+Create Date: 2026-10-18 13:05:27.419830+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0b9d4e6f2a71'
+down_revision = 'f5a0b8c3e7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Replace the (tenant_id, uploaded_by) index with a covering
+    (tenant_id, uploaded_by, status) INCLUDE (filename, created_at) index.
+    
+    The new index has the old one as a prefix and tenant_id as its leading
+    column, so the two-column and single-column tenant indexes are dropped.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_documents_tenant_uploader_status',
+            'documents',
+            ['tenant_id', 'uploaded_by', 'status'],
+            postgresql_include=['filename', 'created_at'],
+            postgresql_concurrently=True
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_documents_tenant_uploaded_by')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_documents_tenant')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_documents_tenant_id')
+
+
+def downgrade() -> None:
+    """Rollback: restore the original tenant indexes"""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_documents_tenant',
+            'documents',
+            ['tenant_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_documents_tenant_id',
+            'documents',
+            ['tenant_id'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_documents_tenant_uploaded_by',
+            'documents',
+            ['tenant_id', 'uploaded_by'],
+            postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_documents_tenant_uploader_status',
+            table_name='documents',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,48 @@
+"""conversation_retention_last_accessed_default
+
+Revision ID: 1c7e3a9b5d24
+Revises: 0b9d4e6f2a71
+Create Date: 2026-10-18 13:21:52.604117+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1c7e3a9b5d24'
+down_revision = '0b9d4e6f2a71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Default conversation_retention.last_accessed_at to now() on the server.
+    
+    Existing naive values were written with datetime.utcnow(), so they are
+    interpreted as UTC when converting to timestamptz.
+    """
+    op.execute('UPDATE conversation_retention SET last_accessed_at = now() WHERE last_accessed_at IS NULL')
+    op.alter_column(
+        'conversation_retention',
+        'last_accessed_at',
+        existing_type=sa.DateTime(),
+        type_=sa.DateTime(timezone=True),
+        server_default=sa.text('now()'),
+        nullable=False,
+        postgresql_using="last_accessed_at AT TIME ZONE 'UTC'"
+    )
+
+
+def downgrade() -> None:
+    """Rollback: naive timestamp with the value supplied by the application"""
+    op.alter_column(
+        'conversation_retention',
+        'last_accessed_at',
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.DateTime(),
+        server_default=None,
+        nullable=True,
+        postgresql_using="last_accessed_at AT TIME ZONE 'UTC'"
+    )
@@ -0,0 +1,58 @@
+"""documents_full_text_tsvector
+
+Revision ID: 2e8f4b0c6a93
+Revises: 1c7e3a9b5d24
+Create Date: 2026-10-18 13:48:09.331586+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2e8f4b0c6a93'
+down_revision = '1c7e3a9b5d24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add a stored tsvector over documents.full_text with a GIN index.
+    
+    Keyword search matches bodies with full_text_tsv @@ plainto_tsquery(...)
+    instead of a sequential ILIKE '%...%' over every full_text value.
+    A trigram index on description lets the planner combine all three
+    search predicates (title, description, body) with a BitmapOr.
+    
+    The expression index idx_documents_fulltext_gin is dropped: no query
+    matches its expression, and it is rebuilt on every write.
+    """
+    op.execute("""
+        ALTER TABLE documents
+        ADD COLUMN full_text_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('english', coalesce(full_text, ''))) STORED
+    """)
+    op.execute('CREATE INDEX idx_documents_fts ON documents USING gin (full_text_tsv)')
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_documents_description_trgm '
+        'ON documents USING gin (description gin_trgm_ops)'
+    )
+    op.execute('DROP INDEX IF EXISTS idx_documents_fulltext_gin')
+
+
+def downgrade() -> None:
+    """Rollback: restore the expression index, drop the column and new indexes"""
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_documents_fulltext_gin 
+        ON documents USING gin(to_tsvector('english', 
+            COALESCE(filename, '') || ' ' || 
+            COALESCE(title, '') || ' ' || 
+            COALESCE(description, '') || ' ' || 
+            COALESCE(full_text, '')
+        ))
+    """)
+    op.drop_index('idx_documents_description_trgm', table_name='documents')
+    op.drop_index('idx_documents_fts', table_name='documents')
+    op.drop_column('documents', 'full_text_tsv')
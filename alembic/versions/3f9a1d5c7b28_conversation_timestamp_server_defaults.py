@@ -0,0 +1,38 @@
+"""conversation_timestamp_server_defaults
+
+Revision ID: 3f9a1d5c7b28
+Revises: 2e8f4b0c6a93
+Create Date: 2026-10-18 14:22:37.518204+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1d5c7b28'
+down_revision = '2e8f4b0c6a93'
+branch_labels = None
+depends_on = None
+
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+
+def upgrade() -> None:
+    """
+    Let Postgres stamp conversation and message timestamps.
+    
+    The columns stay naive UTC; the ORM no longer sends datetime.utcnow()
+    values and reads the generated ones back with RETURNING.
+    """
+    op.alter_column('conversations', 'created_at', server_default=UTC_NOW)
+    op.alter_column('conversations', 'updated_at', server_default=UTC_NOW)
+    op.alter_column('messages', 'created_at', server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    """Remove timestamp server defaults"""
+    op.alter_column('messages', 'created_at', server_default=None)
+    op.alter_column('conversations', 'updated_at', server_default=None)
+    op.alter_column('conversations', 'created_at', server_default=None)
@@ -0,0 +1,56 @@
+"""conversation_document_ids_array
+
+Revision ID: 4a2c6e8d0f15
+Revises: 3f9a1d5c7b28
+Create Date: 2026-10-18 14:51:03.284716+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '4a2c6e8d0f15'
+down_revision = '3f9a1d5c7b28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Move conversation_metadata['document_ids'] into a uuid[] column.
+    
+    Readers get native UUIDs from the driver instead of decoding JSON and
+    re-parsing strings on every chat turn.
+    """
+    op.add_column(
+        'conversations',
+        sa.Column(
+            'document_ids',
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default=sa.text("'{}'"),
+        ),
+    )
+    op.execute("""
+        UPDATE conversations
+        SET document_ids = ARRAY(
+                SELECT json_array_elements_text(conversation_metadata -> 'document_ids')::uuid
+            ),
+            conversation_metadata = (conversation_metadata::jsonb - 'document_ids')::json
+        WHERE json_typeof(conversation_metadata -> 'document_ids') = 'array'
+    """)
+
+
+def downgrade() -> None:
+    """Copy document_ids back into conversation_metadata and drop the column"""
+    op.execute("""
+        UPDATE conversations
+        SET conversation_metadata = (
+            coalesce(conversation_metadata::jsonb, '{}'::jsonb)
+            || jsonb_build_object('document_ids', to_jsonb(document_ids::text[]))
+        )::json
+        WHERE cardinality(document_ids) > 0
+    """)
+    op.drop_column('conversations', 'document_ids')
@@ -0,0 +1,37 @@
+"""add_user_roles_expiry_index
+
+Revision ID: 4f2a9c1d7e3b
+Revises: 57f71a0a3633
+Create Date: 2026-10-18 09:12:41.508213+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2a9c1d7e3b'
+down_revision = '57f71a0a3633'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Index user_roles on (user_id, expires_at) for the active-role lookup.
+    
+    A partial index on "expires_at > now()" is not allowed (index predicates
+    must be immutable), so the expiry column is carried in the index instead
+    and the filter is resolved without touching the heap for expired rows.
+    """
+    op.create_index(
+        'idx_user_roles_user_expires',
+        'user_roles',
+        ['user_id', 'expires_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Remove user_roles expiry index"""
+    op.drop_index('idx_user_roles_user_expires', table_name='user_roles')
@@ -0,0 +1,45 @@
+"""revoked_tokens_expires_at_timestamptz
+
+Revision ID: 9d61e0b3a5c8
+Revises: 4f2a9c1d7e3b
+Create Date: 2026-10-18 09:40:07.114562+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d61e0b3a5c8'
+down_revision = '4f2a9c1d7e3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Store revoked_tokens.expires_at as timestamptz instead of ISO text.
+    
+    Existing ISO strings are cast in place; idx_revoked_token_expires is
+    rebuilt by PostgreSQL as part of the type change.
+    """
+    op.alter_column(
+        'revoked_tokens',
+        'expires_at',
+        existing_type=sa.String(length=50),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        postgresql_using='expires_at::timestamptz'
+    )
+
+
+def downgrade() -> None:
+    """Rollback: store expires_at as ISO text again"""
+    op.alter_column(
+        'revoked_tokens',
+        'expires_at',
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.String(length=50),
+        existing_nullable=False,
+        postgresql_using="to_char(expires_at AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS')"
+    )
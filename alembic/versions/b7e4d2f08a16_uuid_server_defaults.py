@@ -0,0 +1,38 @@
+"""uuid_server_defaults
+
+Revision ID: b7e4d2f08a16
+Revises: 9d61e0b3a5c8
+Create Date: 2026-10-18 10:05:52.730119+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e4d2f08a16'
+down_revision = '9d61e0b3a5c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Generate UUID keys server-side with gen_random_uuid().
+    
+    The columns are already native UUID; this only adds server defaults so
+    Core-level and bulk inserts don't need to build UUIDs in Python.
+    pgcrypto provides gen_random_uuid() on PostgreSQL < 13.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    
+    op.alter_column('documents', 'uuid', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('conversations', 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('messages', 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    """Remove UUID server defaults"""
+    op.alter_column('messages', 'id', server_default=None)
+    op.alter_column('conversations', 'id', server_default=None)
+    op.alter_column('documents', 'uuid', server_default=None)
@@ -0,0 +1,44 @@
+"""document_chunks_pgvector_embeddings
+
+Revision ID: c1a5f9e27b30
+Revises: b7e4d2f08a16
+Create Date: 2026-10-18 11:02:36.441870+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c1a5f9e27b30'
+down_revision = 'b7e4d2f08a16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Store document_chunks.embedding_vector as pgvector vector(384).
+    
+    Nothing has written embeddings to this column so far (they live in
+    Qdrant), so existing values are reset rather than decoded from bytea.
+    An HNSW index enables server-side cosine k-NN.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.execute(
+        'ALTER TABLE document_chunks '
+        'ALTER COLUMN embedding_vector TYPE vector(384) USING NULL'
+    )
+    op.execute(
+        'CREATE INDEX idx_document_chunks_embedding_hnsw ON document_chunks '
+        'USING hnsw (embedding_vector vector_cosine_ops)'
+    )
+
+
+def downgrade() -> None:
+    """Rollback: store embeddings as raw float32 bytes again"""
+    op.drop_index('idx_document_chunks_embedding_hnsw', table_name='document_chunks')
+    op.execute(
+        'ALTER TABLE document_chunks '
+        'ALTER COLUMN embedding_vector TYPE bytea USING NULL'
+    )
@@ -0,0 +1,47 @@
+"""document_chunks_halfvec_embeddings
+
+Revision ID: d8b3c6a4e915
+Revises: c1a5f9e27b30
+Create Date: 2026-10-18 11:27:09.305518+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8b3c6a4e915'
+down_revision = 'c1a5f9e27b30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Quantize document_chunks.embedding_vector from vector (fp32) to halfvec (fp16).
+    
+    Requires pgvector >= 0.7. Halves row and HNSW index size; cosine ranking
+    is effectively unchanged for normalized sentence embeddings.
+    """
+    op.drop_index('idx_document_chunks_embedding_hnsw', table_name='document_chunks')
+    op.execute(
+        'ALTER TABLE document_chunks '
+        'ALTER COLUMN embedding_vector TYPE halfvec(384) USING embedding_vector::halfvec(384)'
+    )
+    op.execute(
+        'CREATE INDEX idx_document_chunks_embedding_hnsw ON document_chunks '
+        'USING hnsw (embedding_vector halfvec_cosine_ops)'
+    )
+
+
+def downgrade() -> None:
+    """Rollback: store embeddings as fp32 vector again"""
+    op.drop_index('idx_document_chunks_embedding_hnsw', table_name='document_chunks')
+    op.execute(
+        'ALTER TABLE document_chunks '
+        'ALTER COLUMN embedding_vector TYPE vector(384) USING embedding_vector::vector(384)'
+    )
+    op.execute(
+        'CREATE INDEX idx_document_chunks_embedding_hnsw ON document_chunks '
+        'USING hnsw (embedding_vector vector_cosine_ops)'
+    )
@@ -0,0 +1,34 @@
+"""lz4_toast_compression_for_text_columns
+
+Revision ID: e2f7a0c9d1b6
+Revises: d8b3c6a4e915
+Create Date: 2026-10-18 11:58:44.017392+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2f7a0c9d1b6'
+down_revision = 'd8b3c6a4e915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Compress large text columns with lz4 instead of pglz (PostgreSQL 14+).
+    
+    lz4 decompresses several times faster, which matters for full_text reads
+    and chunk loads during retrieval. Only newly written values use lz4;
+    existing rows keep pglz until they are rewritten.
+    """
+    op.execute('ALTER TABLE documents ALTER COLUMN full_text SET COMPRESSION lz4')
+    op.execute('ALTER TABLE document_chunks ALTER COLUMN content SET COMPRESSION lz4')
+
+
+def downgrade() -> None:
+    """Rollback: use the server default compression again"""
+    op.execute('ALTER TABLE document_chunks ALTER COLUMN content SET COMPRESSION default')
+    op.execute('ALTER TABLE documents ALTER COLUMN full_text SET COMPRESSION default')
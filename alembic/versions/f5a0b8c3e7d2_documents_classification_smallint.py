@@ -0,0 +1,57 @@
+"""documents_classification_smallint
+
+Revision ID: f5a0b8c3e7d2
+Revises: e2f7a0c9d1b6
+Create Date: 2026-10-18 12:40:15.872604+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5a0b8c3e7d2'
+down_revision = 'e2f7a0c9d1b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Store documents.classification as SMALLINT (0=PUBLIC .. 3=CONFIDENTIAL).
+    
+    The codes match DocumentClassification's hierarchy order. ix_documents_classification
+    is rebuilt by the type change with 2-byte keys. The column default
+    becomes 1 (INTERNAL).
+    """
+    op.execute('ALTER TABLE documents ALTER COLUMN classification DROP DEFAULT')
+    op.execute("""
+        ALTER TABLE documents
+        ALTER COLUMN classification TYPE smallint
+        USING CASE classification::text
+            WHEN 'PUBLIC' THEN 0
+            WHEN 'INTERNAL' THEN 1
+            WHEN 'RESTRICTED' THEN 2
+            WHEN 'CONFIDENTIAL' THEN 3
+        END
+    """)
+    op.execute('ALTER TABLE documents ALTER COLUMN classification SET DEFAULT 1')
+    op.create_check_constraint(
+        'ck_documents_classification',
+        'documents',
+        'classification BETWEEN 0 AND 3'
+    )
+    op.execute('DROP TYPE IF EXISTS documentclassification')
+
+
+def downgrade() -> None:
+    """Rollback: store classification as the native enum again"""
+    op.drop_constraint('ck_documents_classification', 'documents', type_='check')
+    op.execute('ALTER TABLE documents ALTER COLUMN classification DROP DEFAULT')
+    op.execute("CREATE TYPE documentclassification AS ENUM ('PUBLIC', 'INTERNAL', 'RESTRICTED', 'CONFIDENTIAL')")
+    op.execute("""
+        ALTER TABLE documents
+        ALTER COLUMN classification TYPE documentclassification
+        USING (ARRAY['PUBLIC', 'INTERNAL', 'RESTRICTED', 'CONFIDENTIAL'])[classification + 1]::documentclassification
+    """)
+    op.execute("ALTER TABLE documents ALTER COLUMN classification SET DEFAULT 'INTERNAL'")
@@ -0,0 +1,39 @@
+"""add_document_permissions_covering_index
+
+Revision ID: 5c3e8a71f2d4
+Revises: 1930c41ac152
+Create Date: 2026-10-18 10:31:18.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '5c3e8a71f2d4'
+down_revision = '1930c41ac152'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covering index for access checks: user_id leads so "documents shared
+    # with user X" is a range scan, and expires_at is carried as a payload
+    # column so the expiry filter doesn't need a heap fetch. A partial index
+    # on "expires_at > now()" isn't possible (predicate must be immutable).
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_docperm_user_doc_perm',
+            'document_permissions',
+            ['user_id', 'document_id', 'permission_type'],
+            postgresql_include=['expires_at'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_docperm_user_doc_perm',
+            table_name='document_permissions',
+            postgresql_concurrently=True
+        )
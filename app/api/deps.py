@@ -1,20 +1,95 @@
 """
 API Dependencies
 """
-from typing import AsyncGenerator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Callable, Optional, Type, TypeVar
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import BaseModel, ValidationError
+from pydantic_core import from_json
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from jose import JWTError, jwt
 
 from app.db.session import get_db
 from app.core.config import settings
 from app.models.user import User
-from app.core.security import require_admin, require_uploader, require_viewer, require_reviewer, require_compliance
+from app.core.security import (
+    load_user_with_rbac,
+    require_admin,
+    require_uploader,
+    require_viewer,
+    require_reviewer,
+    require_compliance,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_PREFIX}/auth/login")
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _body_validation_error(e: ValidationError, body: bytes) -> RequestValidationError:
+    """Report a body validation failure the way FastAPI does (loc under "body")"""
+    errors = e.errors(include_url=False)
+    for err in errors:
+        err["loc"] = ("body", *err["loc"])
+    return RequestValidationError(errors, body=body)
+
+
+def json_body(model: Type[ModelT]) -> Callable:
+    """
+    Dependency that parses and validates the raw JSON body in one pass
+    
+    model_validate_json parses the bytes directly in pydantic-core instead of
+    FastAPI's json.loads followed by validation of the resulting dict. Routes
+    using it should pass json_body_openapi(model) as openapi_extra so the
+    request body stays documented.
+    """
+    async def dependency(request: Request) -> ModelT:
+        body = await request.body()
+        try:
+            return model.model_validate_json(body)
+        except ValidationError as e:
+            raise _body_validation_error(e, body)
+    return dependency
+
+
+def json_body_narrowed(model: Type[ModelT], *narrow: Type[BaseModel]) -> Callable:
+    """
+    json_body(model) for bodies that usually touch a single field group
+    
+    The body is validated with the first of narrow whose fields cover every
+    key sent, so only that group's validators run; mixed bodies (and anything
+    that is not a JSON object) fall back to model. The keys are read with a
+    plain from_json scan; validation itself still parses the raw bytes once,
+    as json_body does.
+    """
+    async def dependency(request: Request) -> BaseModel:
+        body = await request.body()
+        target = model
+        try:
+            data = from_json(body, allow_partial=False, cache_strings="keys")
+        except ValueError:
+            # Invalid JSON: let model report it in its usual json_invalid form
+            data = None
+        if isinstance(data, dict):
+            keys = data.keys()
+            target = next((m for m in narrow if keys <= m.model_fields.keys()), model)
+        try:
+            return target.model_validate_json(body)
+        except ValidationError as e:
+            raise _body_validation_error(e, body)
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """openapi_extra describing a json_body(model) request body"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -41,11 +116,8 @@ async def get_current_user(
     except (JWTError, ValueError):
         raise credentials_exception
     
-    # Get user from database by email
-    result = await db.execute(
-        select(User).where(User.email == email)
-    )
-    user = result.scalar_one_or_none()
+    # Get user from database by email with roles/permissions resolved
+    user = await load_user_with_rbac(db, email)
     
     if user is None:
         raise credentials_exception
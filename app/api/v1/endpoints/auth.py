@@ -21,6 +21,7 @@ from app.core.security import (
 from app.core.mfa import is_mfa_required_for_role
 from app.core.auth_lockout import auth_lockout_manager
 from app.db.session import get_db
+from app.core.cache import cache_service
 from app.models.user import User
 from app.models.token_revocation import RevokedToken
 from app.schemas.auth import Token, UserCreate, UserResponse, RefreshTokenRequest
@@ -352,8 +353,8 @@ async def logout(
         
         if jti and exp_timestamp:
             # Add to revocation list
-            from datetime import datetime
-            expires_at = datetime.fromtimestamp(exp_timestamp).isoformat()
+            from datetime import datetime, timezone
+            expires_at = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
             
             revoked_token = RevokedToken(
                 jti=jti,
@@ -363,6 +364,10 @@ async def logout(
                 expires_at=expires_at
             )
             db.add(revoked_token)
+            
+            # Mirror into Redis so auth checks don't need a DB lookup
+            ttl = int(exp_timestamp - time.time())
+            await cache_service.add_revoked_token(jti, ttl)
     except Exception:
         pass  # If we can't revoke, still log the logout
     
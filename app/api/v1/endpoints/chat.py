@@ -21,7 +21,7 @@ from app.api.deps import get_current_user, get_db
 from app.models.user import User
 from app.schemas.conversation import (
     ConversationCreate, ConversationResponse, ConversationListResponse,
-    ChatRequest, ChatResponse, MessageResponse
+    ChatRequest, ChatResponse, MessageResponse, MESSAGE_LIST_ADAPTER
 )
 from app.services.conversation_service import ConversationService
 from app.services.search_service import SearchService
@@ -127,7 +127,7 @@ async def list_conversations(
                 metadata=conv.conversation_metadata or {},
                 created_at=conv.created_at,
                 updated_at=conv.updated_at,
-                messages=[MessageResponse.from_orm(msg) for msg in messages]
+                messages=MESSAGE_LIST_ADAPTER.validate_python(messages, from_attributes=True)
             ))
         
         return ConversationListResponse(
@@ -193,7 +193,7 @@ async def get_conversation(
             metadata=conversation.conversation_metadata or {},
             created_at=conversation.created_at,
             updated_at=conversation.updated_at,
-            messages=[MessageResponse.from_orm(msg) for msg in messages]
+            messages=MESSAGE_LIST_ADAPTER.validate_python(messages, from_attributes=True)
         )
         
     except HTTPException:
@@ -238,15 +238,10 @@ async def chat(
             if conversation is None:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation not found")
             
-            # ALWAYS update conversation metadata with current document_ids
-            current_metadata = conversation.conversation_metadata or {}
+            # ALWAYS update the conversation's document_ids with the current selection;
+            # keep the existing ones if none were provided in this request
             if chat_request.document_ids:
-                current_metadata["document_ids"] = [str(d) for d in chat_request.document_ids]
-            # Keep existing document_ids if none provided in this request
-            elif "document_ids" not in current_metadata:
-                current_metadata["document_ids"] = []
-            
-            conversation.conversation_metadata = current_metadata
+                conversation.document_ids = list(chat_request.document_ids)
             conversation.updated_at = datetime.utcnow()
             # Will be committed by get_db dependency
                 
@@ -258,7 +253,8 @@ async def chat(
                 user_id=current_user.id,
                 document_id=None,
                 title=chat_request.message[:60] if chat_request.message else "New Conversation",
-                conversation_metadata={"document_ids": [str(d) for d in (chat_request.document_ids or [])]}
+                document_ids=list(chat_request.document_ids or []),
+                conversation_metadata={}
             )
             db.add(conversation)
             await db.flush()  # Flush to get conversation ID
@@ -318,8 +314,7 @@ async def chat(
         # Only use rule-based count for simple, single-purpose count questions
         if is_count_question and not is_multipart_query:
             logger.info("Processing count query")
-            meta = conversation.conversation_metadata or {}
-            doc_ids = chat_request.document_ids or meta.get("document_ids", [])
+            doc_ids = chat_request.document_ids or conversation.document_ids
             total_docs = 0
             breakdown_text = ""
             
@@ -377,9 +372,9 @@ async def chat(
             await db.flush()  # Flush to get message ID
             # Will be committed by get_db dependency
 
-            user_msg_resp = MessageResponse.from_orm(user_message)
+            user_msg_resp = MessageResponse.model_validate(user_message)
             user_msg_resp.metadata["document_ids"] = [str(d) for d in (chat_request.document_ids or [])]
-            assistant_msg_resp = MessageResponse.from_orm(assistant_message)
+            assistant_msg_resp = MessageResponse.model_validate(assistant_message)
             return ChatResponse(
                 conversation_id=conversation.id,
                 message=user_msg_resp,
@@ -432,8 +427,7 @@ async def chat(
         
         if is_analytics_intent:
             # Compute aggregates within current scope
-            meta = conversation.conversation_metadata or {}
-            selected_doc_uuids = chat_request.document_ids or meta.get("document_ids", [])
+            selected_doc_uuids = chat_request.document_ids or conversation.document_ids
             
             # Helper to format sizes
             def _format_size(num_bytes: int) -> str:
@@ -540,9 +534,9 @@ async def chat(
             await db.flush()  # Flush to get message ID
             # Will be committed by get_db dependency
 
-            user_msg_resp = MessageResponse.from_orm(user_message)
+            user_msg_resp = MessageResponse.model_validate(user_message)
             user_msg_resp.metadata["document_ids"] = [str(d) for d in (chat_request.document_ids or [])]
-            assistant_msg_resp = MessageResponse.from_orm(assistant_message)
+            assistant_msg_resp = MessageResponse.model_validate(assistant_message)
             return ChatResponse(
                 conversation_id=conversation.id,
                 message=user_msg_resp,
@@ -555,8 +549,7 @@ async def chat(
         
         # Build intelligent context with proper sizing
         try:
-            meta = conversation.conversation_metadata or {}
-            doc_ids = chat_request.document_ids or meta.get("document_ids", [])
+            doc_ids = chat_request.document_ids or conversation.document_ids
             logger.info(f"Chat doc_ids: {doc_ids}")
             
             # Extract keyword(s) for summarize-by-keyword intent
@@ -615,16 +608,16 @@ async def chat(
                         "context_used": False,
                         "model_used": "relationship-list",
                         "token_budget": 0,
-                        "scope": "selected" if (chat_request.document_ids or meta.get("document_ids")) else "all_accessible"
+                        "scope": "selected" if (chat_request.document_ids or conversation.document_ids) else "all_accessible"
                     }
                 )
                 db.add(assistant_message)
                 await db.flush()  # Flush to get message ID
                 # Will be committed by get_db dependency
 
-                user_msg_resp = MessageResponse.from_orm(user_message)
+                user_msg_resp = MessageResponse.model_validate(user_message)
                 user_msg_resp.metadata["document_ids"] = [str(d) for d in (chat_request.document_ids or [])]
-                assistant_msg_resp = MessageResponse.from_orm(assistant_message)
+                assistant_msg_resp = MessageResponse.model_validate(assistant_message)
                 return ChatResponse(
                     conversation_id=conversation.id,
                     message=user_msg_resp,
@@ -770,7 +763,7 @@ async def chat(
                 "token_budget": token_budget if 'token_budget' in locals() else 0,
                 # Provide light-weight source list for UI rendering
                 "sources": context_manager.safe_extract_sources(context_metadata) if 'context_metadata' in locals() else [],
-                "scope": "selected" if (chat_request.document_ids or meta.get("document_ids")) else "all_accessible"
+                "scope": "selected" if (chat_request.document_ids or conversation.document_ids) else "all_accessible"
             }
         )
         db.add(assistant_message)
@@ -778,10 +771,10 @@ async def chat(
         # Will be committed by get_db dependency
 
         # Construct message and response payloads, ensuring document_ids are included
-        user_msg_resp = MessageResponse.from_orm(user_message)
+        user_msg_resp = MessageResponse.model_validate(user_message)
         # Always include document_ids metadata from request
         user_msg_resp.metadata["document_ids"] = [str(d) for d in (chat_request.document_ids or [])]
-        assistant_msg_resp = MessageResponse.from_orm(assistant_message)
+        assistant_msg_resp = MessageResponse.model_validate(assistant_message)
         
         # CRITICAL: Extract source citations from documents used
         from app.schemas.conversation import SourceCitation
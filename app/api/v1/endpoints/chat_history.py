@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db, get_current_user
 from app.models.user import User
 from app.services.chat_history_service import chat_history_service, StorageQuotaExceeded
-from app.schemas.conversation import ConversationResponse, ConversationListResponse
+from app.schemas.conversation import ConversationResponse, ConversationListResponse, CONVERSATION_LIST_ADAPTER
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,10 +33,9 @@ async def get_chat_history(
         )
         
         return ConversationListResponse(
-            conversations=[
-                ConversationResponse.from_orm(conv) 
-                for conv in conversations
-            ],
+            conversations=CONVERSATION_LIST_ADAPTER.validate_python(
+                conversations, from_attributes=True
+            ),
             total=total,
             page=offset // limit + 1,
             page_size=limit
@@ -7,7 +7,7 @@ Per Review C5.4: Progressive text display
 import asyncio
 import json
 import logging
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -26,7 +26,8 @@ async def generate_sse_stream(
     conversation_service: AsyncConversationService,
     user_id: int,
     tenant_id: str,
-    chat_request: ChatRequest
+    chat_request: ChatRequest,
+    user: Optional[User] = None
 ) -> AsyncGenerator[str, None]:
     """
     Generate Server-Sent Events stream for chat response
@@ -58,7 +59,8 @@ async def generate_sse_stream(
         response_obj = await conversation_service.process_chat_message(
             user_id=user_id,
             tenant_id=tenant_id,
-            chat_request=chat_request
+            chat_request=chat_request,
+            user=user
         )
         
         # Step 6: Stream response in chunks (simulate streaming)
@@ -120,7 +122,8 @@ async def chat_stream(
             conversation_service=service,
             user_id=current_user.id,
             tenant_id=current_user.tenant_id,
-            chat_request=chat_request
+            chat_request=chat_request,
+            user=current_user
         ),
         media_type="text/event-stream",
         headers={
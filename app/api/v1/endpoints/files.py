@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File,
 from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, func, String
+from sqlalchemy.orm import undefer
 import hashlib
 import logging
 from pathlib import Path
@@ -430,7 +431,9 @@ async def get_document(
     
     # Get document
     result = await db.execute(
-        select(Document).where(Document.uuid == document_id)
+        select(Document)
+        .where(Document.uuid == document_id)
+        .options(undefer(Document.full_text))
     )
     document = result.scalar_one_or_none()
     
@@ -541,7 +544,9 @@ async def update_document(
     
     # Get document
     result = await db.execute(
-        select(Document).where(Document.uuid == document_id)
+        select(Document)
+        .where(Document.uuid == document_id)
+        .options(undefer(Document.full_text))
     )
     document = result.scalar_one_or_none()
     
@@ -992,15 +997,21 @@ async def bulk_document_action(
     
     # Perform action
     if action == "delete":
-        for doc in accessible_docs:
-            try:
-                await db.delete(doc)
-                success_count += 1
-            except Exception as e:
-                logger.error(f"Error deleting document {doc.uuid}: {e}")
-                error_count += 1
+        from app.services.atomic_deletion_service import AtomicDeletionService
         
-        # Will be committed by get_db dependency
+        # One atomic deletion for the whole batch, across DB, search
+        # indexes and storage; on failure nothing is removed
+        try:
+            await AtomicDeletionService(db).delete_documents_atomic(
+                accessible_docs,
+                user_id=current_user.id,
+                user_email=current_user.email,
+                user_role=getattr(current_user.role, "value", current_user.role)
+            )
+            success_count = len(accessible_docs)
+        except Exception as e:
+            logger.error(f"Error deleting {len(accessible_docs)} documents: {e}")
+            error_count = len(accessible_docs)
     
     elif action == "reindex":
         # Queue reindexing tasks
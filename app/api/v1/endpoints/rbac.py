@@ -12,6 +12,7 @@ from app.models.user import User
 from app.models.role import Role, Permission, UserRole as UserRoleModel, RolePermission
 from app.core.security import get_current_user
 from app.core.rbac import require_permission, require_role
+from app.core.cache import cache_service
 
 router = APIRouter()
 
@@ -327,6 +328,8 @@ async def remove_permission_from_role(
         )
     )
     await db.commit()
+    # Bulk DELETE bypasses the mapper events that normally invalidate this
+    await cache_service.invalidate_user_rbac()
     
     return {"message": "Permission removed from role"}
 
@@ -436,6 +439,8 @@ async def remove_role_from_user(
         )
     )
     await db.commit()
+    # Bulk DELETE bypasses the mapper events that normally invalidate this
+    await cache_service.invalidate_user_rbac(user_id)
     
     return {"message": "Role removed from user"}
 
@@ -1,20 +1,22 @@
 """
 User management endpoints with full CRUD operations
 """
-from typing import List, Optional
+from typing import List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
-from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user, json_body, json_body_narrowed, json_body_openapi
 from app.models.user import User, UserRole
 from app.schemas.user import (
     UserCreate,
     UserUpdate,
+    UserProfileUpdate,
+    UserAdminUpdate,
+    UserPasswordUpdate,
     UserResponse,
-    UserListResponse,
-    PasswordReset,
+    USER_LIST_ADAPTER,
     UserStatusUpdate
 )
 from app.core.security import get_password_hash
@@ -24,6 +26,41 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Precomputed role lookups: request values may be role names ("ADMIN") or
+# values ("Admin"); plain dict gets avoid Enum lookups with KeyError fallbacks
+_ROLE_BY_NAME = dict(UserRole.__members__)
+_ROLE_BY_VALUE = dict(UserRole._value2member_map_)
+
+
+def _resolve_role(value):
+    """Map a role name/value to UserRole, passing unknown values through"""
+    return _ROLE_BY_NAME.get(value) or _ROLE_BY_VALUE.get(value, value)
+
+
+def _user_list_response(users) -> Response:
+    """
+    Serialize ORM users once and return them directly.
+    
+    Returning a Response skips FastAPI's second response_model validation and
+    jsonable_encoder pass; response_model stays on the route for OpenAPI.
+    """
+    items = USER_LIST_ADAPTER.validate_python(users, from_attributes=True)
+    return Response(content=USER_LIST_ADAPTER.dump_json(items), media_type="application/json")
+
+
+def _user_response(user: User, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Serialize one ORM user without validation and return it directly.
+    
+    Like _user_list_response, returning a Response means response_model only
+    documents the route; the row is not validated again on the way out.
+    """
+    return Response(
+        content=UserResponse.from_orm_fast(user).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -33,7 +70,7 @@ async def get_current_user_info(
     Get current authenticated user's information.
     Any authenticated user can access this endpoint.
     """
-    return UserResponse.model_validate(current_user)
+    return _user_response(current_user)
 
 
 @router.get("/", response_model=List[UserResponse])
@@ -68,12 +105,7 @@ async def list_users(
         query = query.where(search_filter)
     
     if role:
-        try:
-            role_enum = UserRole[role]
-            query = query.where(User.role == role_enum)
-        except KeyError:
-            # If role is already a string value, compare directly
-            query = query.where(User.role == role)
+        query = query.where(User.role == _resolve_role(role))
     
     if is_active is not None:
         query = query.where(User.is_active == is_active)
@@ -84,12 +116,17 @@ async def list_users(
     result = await db.execute(query)
     users = result.scalars().all()
     
-    return [UserResponse.model_validate(user) for user in users]
+    return _user_list_response(users)
 
 
-@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=UserResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(UserCreate)
+)
 async def create_user(
-    user_data: UserCreate,
+    user_data: UserCreate = Depends(json_body(UserCreate)),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -141,7 +178,7 @@ async def create_user(
     
     logger.info(f"User {new_user.email} created by {current_user.email}")
     
-    return UserResponse.model_validate(new_user)
+    return _user_response(new_user, status.HTTP_201_CREATED)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -169,13 +206,15 @@ async def get_user(
             detail="User not found"
         )
     
-    return UserResponse.model_validate(user)
+    return _user_response(user)
 
 
-@router.put("/{user_id}", response_model=UserResponse)
+@router.put("/{user_id}", response_model=UserResponse, openapi_extra=json_body_openapi(UserUpdate))
 async def update_user(
     user_id: int,
-    user_data: UserUpdate,
+    user_data: Union[UserProfileUpdate, UserAdminUpdate, UserPasswordUpdate] = Depends(
+        json_body_narrowed(UserUpdate, UserProfileUpdate, UserAdminUpdate, UserPasswordUpdate)
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -199,7 +238,7 @@ async def update_user(
         )
     
     # Update fields
-    update_data = user_data.dict(exclude_unset=True)
+    update_data = user_data.model_dump(exclude_unset=True)
     
     # Non-admins can't change certain fields
     if getattr(current_user.role, "value", current_user.role) != "Admin":
@@ -209,11 +248,7 @@ async def update_user(
     
     # Handle role update
     if 'role' in update_data and isinstance(update_data['role'], str):
-        try:
-            update_data['role'] = UserRole[update_data['role']]
-        except KeyError:
-            # If role is already a string value, keep it as is
-            pass
+        update_data['role'] = _resolve_role(update_data['role'])
     
     # Handle password update
     if 'password' in update_data:
@@ -228,7 +263,7 @@ async def update_user(
     
     logger.info(f"User {user.email} updated by {current_user.email}")
     
-    return UserResponse.model_validate(user)
+    return _user_response(user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -367,7 +402,7 @@ async def update_user_status(
         f"by {current_user.email}"
     )
     
-    return UserResponse.model_validate(user)
+    return _user_response(user)
 
 
 @router.get("/team/analysts", response_model=List[UserResponse])
@@ -395,7 +430,7 @@ async def get_team_analysts(
     result = await db.execute(query)
     analysts = result.scalars().all()
     
-    return [UserResponse.model_validate(analyst) for analyst in analysts]
+    return _user_list_response(analysts)
 
 
 @router.get("/statistics", response_model=dict)
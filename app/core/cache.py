@@ -163,6 +163,48 @@ class CacheService:
         cache_key = self._make_key("search", hashlib.md5(f"{query}:{json.dumps(filters, sort_keys=True)}".encode()).hexdigest())
         return await self.get(cache_key)
     
+    async def add_revoked_token(self, jti: str, ttl: int) -> bool:
+        """Record a revoked JWT ID until the token would have expired anyway"""
+        if ttl <= 0:
+            return True
+        return await self.set(self._make_key("jti", jti), 1, ttl)
+    
+    async def is_token_revoked(self, jti: str) -> Optional[bool]:
+        """Check the revoked JWT set; returns None if Redis is unavailable"""
+        if not self.redis_client:
+            await self.connect()
+        if not self.redis_client:
+            return None
+        
+        try:
+            return bool(await self.redis_client.exists(self._make_key("jti", jti)))
+        except Exception as e:
+            logger.warning(f"Cache revocation check error for jti {jti}: {e}")
+            return None
+    
+    async def get_user_rbac(self, user_id: int) -> Optional[Dict[str, List[str]]]:
+        """Get cached role and permission names for a user"""
+        return await self.get(self._make_key("rbac", user_id))
+    
+    async def set_user_rbac(self, user_id: int, roles: List[str], permissions: List[str], ttl: int = 60) -> bool:
+        """Cache role and permission names for a user (short TTL as a backstop)"""
+        return await self.set(self._make_key("rbac", user_id), {"roles": roles, "permissions": permissions}, ttl)
+    
+    async def invalidate_user_rbac(self, user_id: Optional[int] = None) -> bool:
+        """Drop cached RBAC state for one user, or for every user if user_id is None"""
+        if user_id is not None:
+            return await self.delete(self._make_key("rbac", user_id))
+        if not self.redis_client:
+            return False
+        
+        try:
+            async for key in self.redis_client.scan_iter(match="rbac:*", count=500):
+                await self.redis_client.delete(key)
+            return True
+        except Exception as e:
+            logger.warning(f"Cache RBAC invalidation error: {e}")
+            return False
+    
     async def invalidate_document_cache(self, doc_id: str) -> bool:
         """Invalidate all caches related to a document"""
         try:
@@ -3,7 +3,7 @@ Document scope enforcement for role-based access control with ABAC
 """
 from typing import Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select
 
 from app.models.user import User, UserRole
 from app.models.document import Document
@@ -43,15 +43,14 @@ async def get_effective_document_ids(
     Returns:
         Set of document IDs the user can access in this query
     """
-    permitted_ids: Set[int] = set()
     role_str = getattr(user.role, "value", user.role)
+    doc_query = None
     
     # Admin has access to all documents (both RBAC and ABAC)
     if user.role == UserRole.ADMIN:
-        query = select(Document.id, Document.classification)
-        result = await db.execute(query)
+        doc_query = select(Document.id)
         # Admin bypasses classification checks
-        permitted_ids = {row[0] for row in result.all()}
+        enforce_classification = False
     
     # Manager sees their own documents + their analysts' documents
     elif user.role == UserRole.MANAGER:
@@ -62,52 +61,35 @@ async def get_effective_document_ids(
         analyst_ids.add(user.id)  # Include manager's own documents
         
         # Get documents from manager and their analysts
-        doc_query = select(Document.id, Document.classification).where(
+        doc_query = select(Document.id).where(
             Document.uploaded_by.in_(analyst_ids)
         )
-        doc_result = await db.execute(doc_query)
-        
-        # Apply classification filter for Manager (up to Restricted)
-        if enforce_classification:
-            permitted_ids = {
-                row[0] for row in doc_result.all()
-                if DocumentClassification.can_access(role_str, row[1])
-            }
-        else:
-            permitted_ids = {row[0] for row in doc_result.all()}
     
     # Analyst sees only their own documents
     elif user.role == UserRole.ANALYST:
-        doc_query = select(Document.id, Document.classification).where(
+        doc_query = select(Document.id).where(
             Document.uploaded_by == user.id
         )
-        doc_result = await db.execute(doc_query)
-        
-        # Apply classification filter for Analyst (up to Internal)
-        if enforce_classification:
-            permitted_ids = {
-                row[0] for row in doc_result.all()
-                if DocumentClassification.can_access(role_str, row[1])
-            }
-        else:
-            permitted_ids = {row[0] for row in doc_result.all()}
     
     # Legacy roles (backward compatibility during migration)
     elif user.role in [UserRole.REVIEWER, UserRole.UPLOADER, UserRole.VIEWER]:
         # Treat legacy roles as having analyst-level access
-        doc_query = select(Document.id, Document.classification).where(
+        doc_query = select(Document.id).where(
             Document.uploaded_by == user.id
         )
-        doc_result = await db.execute(doc_query)
-        
-        # Apply classification filter (up to Internal for legacy roles)
+    
+    permitted_ids: Set[int] = set()
+    if doc_query is not None:
+        # ABAC: keep only the classifications up to the role's ceiling
+        # (Manager: Restricted, Analyst and legacy roles: Internal)
         if enforce_classification:
-            permitted_ids = {
-                row[0] for row in doc_result.all()
-                if DocumentClassification.can_access(role_str, row[1])
-            }
-        else:
-            permitted_ids = {row[0] for row in doc_result.all()}
+            doc_query = doc_query.where(
+                Document.classification.in_(
+                    DocumentClassification.accessible_levels(role_str)
+                )
+            )
+        doc_result = await db.execute(doc_query)
+        permitted_ids = set(doc_result.scalars().all())
     
     # If user selected specific documents, intersect with permitted set
     # Only apply intersection if selected_ids is not None AND not empty
@@ -1,11 +1,72 @@
 """
 RBAC (Role-Based Access Control) utilities and decorators
 """
+import asyncio
 from functools import wraps
 from typing import List, Optional
 from fastapi import HTTPException, status, Depends
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 from app.models.user import User
+from app.models.role import Role, Permission, UserRole as UserRoleModel, RolePermission
 from app.core.security import get_current_user
+from app.core.cache import cache_service
+
+
+# Session.info key for user ids whose cached RBAC state a pending commit
+# invalidates; None stands for every user
+_RBAC_INFO_KEY = "rbac_invalidated_users"
+
+# Strong references so in-flight invalidation tasks are not garbage collected
+_tasks = set()
+
+
+def _record_rbac_invalidation(target, user_id: Optional[int] = None) -> None:
+    """Note from a (sync) mapper event which cache entries to drop on commit"""
+    session = object_session(target)
+    if session is None:
+        return
+    session.info.setdefault(_RBAC_INFO_KEY, set()).add(user_id)
+
+
+def _invalidate_assigned_user(mapper, connection, target) -> None:
+    _record_rbac_invalidation(target, target.user_id)
+
+
+def _invalidate_all_users(mapper, connection, target) -> None:
+    # Role/permission definitions affect every holder of the role
+    _record_rbac_invalidation(target)
+
+
+def _schedule_rbac_invalidation(session) -> None:
+    """Drop cached RBAC state once the changes are committed"""
+    user_ids = session.info.pop(_RBAC_INFO_KEY, None)
+    if not user_ids:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Sync scripts/Celery: cached entries age out via their short TTL
+        return
+    if None in user_ids:
+        user_ids = {None}
+    for user_id in user_ids:
+        task = loop.create_task(cache_service.invalidate_user_rbac(user_id))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+
+def _discard_rbac_invalidation(session) -> None:
+    session.info.pop(_RBAC_INFO_KEY, None)
+
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(UserRoleModel, _event, _invalidate_assigned_user)
+    for _model in (Role, Permission, RolePermission):
+        event.listen(_model, _event, _invalidate_all_users)
+
+event.listen(Session, "after_commit", _schedule_rbac_invalidation)
+event.listen(Session, "after_rollback", _discard_rbac_invalidation)
 
 
 def require_permission(permission: str):
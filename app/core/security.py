@@ -17,6 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.models.user import User
 from app.db.session import get_db
+from app.core.cache import cache_service
 
 
 # Password hashing
@@ -121,12 +122,19 @@ def decode_token(token: str) -> Dict[str, Any]:
 
 
 async def is_token_revoked(jti: str, db: AsyncSession) -> bool:
-    """Check if a token has been revoked"""
-    # TEMPORARILY DISABLED: Skip token revocation check to avoid transaction issues
-    # The revoked_tokens table may not exist yet
-    return False
+    """
+    Check if a token has been revoked
     
-    # Original implementation commented out:
+    Revocations are mirrored into Redis with a TTL matching the token's
+    remaining lifetime, so this is an in-memory EXISTS rather than a SQL
+    round trip on every authenticated request.
+    """
+    revoked = await cache_service.is_token_revoked(jti)
+    # Redis unavailable: the SQL lookup below stays disabled (it caused
+    # transaction issues), so treat the token as not revoked as before
+    return bool(revoked)
+    
+    # Original SQL implementation, kept for reference:
     # try:
     #     from sqlalchemy import select
     #     from app.models.token_revocation import RevokedToken
@@ -190,22 +198,7 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    # Get user from database by email with RBAC relationships eagerly loaded
-    from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
-    from app.models.role import UserRole as UserRoleModel, Role, RolePermission, Permission
-    
-    result = await db.execute(
-        select(User)
-        .where(User.email == email)
-        .options(
-            selectinload(User.user_roles)
-            .selectinload(UserRoleModel.role)
-            .selectinload(Role.role_permissions)
-            .selectinload(RolePermission.permission)
-        )
-    )
-    user = result.scalar_one_or_none()
+    user = await load_user_with_rbac(db, email)
     
     if user is None:
         raise credentials_exception
@@ -213,6 +206,38 @@ async def get_current_user(
     return user
 
 
+async def load_user_with_rbac(db: AsyncSession, email: str) -> Optional[User]:
+    """
+    Load a user by email with roles and permissions resolved
+    
+    Role/permission names are cached in Redis per user (see
+    cache_service.get_user_rbac), so the common path is a single SELECT on
+    users. On a miss the role/permission graph is selectin-loaded and cached.
+    """
+    from sqlalchemy import select
+    
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
+    if user is None:
+        return None
+    
+    rbac = await cache_service.get_user_rbac(user.id)
+    if rbac is None:
+        await db.execute(
+            select(User)
+            .where(User.id == user.id)
+            .options(*User.rbac_loader_options())
+            .execution_options(populate_existing=True)
+        )
+        roles = sorted(user.get_role_names())
+        permissions = sorted(user.get_permissions())
+        rbac = {"roles": roles, "permissions": permissions}
+        await cache_service.set_user_rbac(user.id, roles, permissions)
+    
+    user.prime_rbac_cache(rbac["roles"], rbac["permissions"])
+    return user
+
+
 class RBACChecker:
     """Role-based access control checker"""
     
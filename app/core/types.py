@@ -1,6 +1,36 @@
 import uuid
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.types import TypeDecorator, CHAR
+from sqlalchemy import Computed
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID as PGUUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.types import TypeDecorator, CHAR, JSON, SmallInteger, Text
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a Python Enum as SMALLINT.
+    Members are encoded by declaration order (0, 1, 2, ...), so new members
+    must only ever be appended.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        if not isinstance(value, self.enum_class):
+            value = self.enum_class(value)
+        return self._codes[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        return self._members[value]
+
 
 class GUID(TypeDecorator):
     """
@@ -36,3 +66,60 @@ class GUID(TypeDecorator):
             return uuid.UUID(str(value))
         except Exception:
             return value
+
+
+class GUIDArray(TypeDecorator):
+    """
+    List of GUIDs.
+    Uses PostgreSQL's uuid[] type, otherwise stores a JSON list of strings.
+    """
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(ARRAY(PGUUID(as_uuid=True)))
+        else:
+            return dialect.type_descriptor(JSON())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return value
+        ids = [v if isinstance(v, uuid.UUID) else uuid.UUID(str(v)) for v in value]
+        if dialect.name == 'postgresql':
+            return ids
+        return [str(v) for v in ids]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return value
+        return [v if isinstance(v, uuid.UUID) else uuid.UUID(str(v)) for v in value]
+
+
+class TSVector(TypeDecorator):
+    """
+    PostgreSQL tsvector; stored as TEXT on other databases (e.g. the SQLite
+    test schema), where full-text matching is not available.
+    """
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(TSVECTOR())
+        return dialect.type_descriptor(Text())
+
+
+class PGComputed(Computed):
+    """
+    Generated column whose expression uses PostgreSQL functions.
+    Other databases create it as a plain nullable column instead.
+    """
+    inherit_cache = True
+
+
+@compiles(PGComputed)
+def _compile_pg_computed(element, compiler, **kw):
+    if compiler.dialect.name == 'postgresql':
+        return compiler.visit_computed_column(element, **kw)
+    return ""
@@ -0,0 +1,159 @@
+"""
+CRUD operations for DocumentChunk bulk ingestion
+"""
+import io
+from typing import Any, Dict, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, delete
+from sqlalchemy.orm import Session
+
+from app.models.document import DocumentChunk
+
+# Batches at or above this size go through COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+# Target size of a text chunk, in characters
+CHUNK_SIZE = 1000
+
+_COPY_COLUMNS = (
+    "document_id",
+    "chunk_index",
+    "content",
+    "chunk_type",
+    "page_number",
+    "start_char",
+    "end_char",
+    "embedding_vector",
+    "embedding_model",
+)
+
+# Connection.info flag: pgvector codecs are registered on this connection
+_VECTOR_CODEC_KEY = "pgvector_codecs"
+
+
+def _copy_field(value: Any) -> str:
+    """Encode one value for COPY ... FROM STDIN (text format)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (list, tuple)) or hasattr(value, "tolist"):
+        # pgvector text input: [x,y,z]
+        return "[" + ",".join(str(float(v)) for v in value) + "]"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex input; the backslash itself must be escaped in text format
+        return "\\\\x" + bytes(value).hex()
+    text = str(value)
+    return (
+        text.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def build_chunk_rows(document_id: int, text: str, chunk_size: int = CHUNK_SIZE) -> List[Dict[str, Any]]:
+    """
+    Split extracted text into DocumentChunk rows
+    
+    Paragraphs (blank-line separated) are packed into chunks of up to
+    chunk_size characters; a longer paragraph is cut at chunk_size. Offsets
+    refer to positions in text.
+    """
+    spans = []
+    pos = 0
+    for paragraph in text.split("\n\n"):
+        start, end = pos, pos + len(paragraph)
+        pos = end + 2
+        if not paragraph.strip():
+            continue
+        for offset in range(start, end, chunk_size):
+            spans.append((offset, min(offset + chunk_size, end)))
+    
+    merged: List[List[int]] = []
+    for start, end in spans:
+        if merged and end - merged[-1][0] <= chunk_size:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    
+    return [
+        {
+            "document_id": document_id,
+            "chunk_index": index,
+            "content": text[start:end],
+            "chunk_type": "paragraph",
+            "start_char": start,
+            "end_char": end,
+        }
+        for index, (start, end) in enumerate(merged)
+    ]
+
+
+async def _copy_chunks(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """Load chunks with asyncpg's binary COPY on the session's connection"""
+    from pgvector.asyncpg import register_vector
+    
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    # Binary COPY needs the vector codec for embedding_vector. Register it
+    # once per DBAPI connection; info lives as long as the connection does
+    if not conn.info.get(_VECTOR_CODEC_KEY):
+        await register_vector(raw.driver_connection)
+        conn.info[_VECTOR_CODEC_KEY] = True
+    await raw.driver_connection.copy_records_to_table(
+        DocumentChunk.__tablename__,
+        records=[tuple(row.get(col) for col in _COPY_COLUMNS) for row in rows],
+        columns=list(_COPY_COLUMNS),
+    )
+
+
+def _copy_chunks_sync(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Load chunks with psycopg2 COPY on the session's connection"""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_field(row.get(col)) for col in _COPY_COLUMNS))
+        buf.write("\n")
+    buf.seek(0)
+    
+    raw = db.connection().connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {DocumentChunk.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN",
+            buf,
+        )
+
+
+async def bulk_insert_chunks(db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert many chunks in a single executemany
+    
+    Goes through Core insert() instead of session.add_all(), so rows skip the
+    unit of work and are batched into multi-row INSERTs (insertmanyvalues).
+    Each row is a dict of DocumentChunk column values. Batches of
+    COPY_THRESHOLD rows or more are loaded with COPY instead.
+    """
+    if not rows:
+        return 0
+    if len(rows) >= COPY_THRESHOLD:
+        await _copy_chunks(db, rows)
+    else:
+        await db.execute(insert(DocumentChunk), rows)
+    return len(rows)
+
+
+def bulk_insert_chunks_sync(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """Synchronous variant of bulk_insert_chunks for Celery tasks"""
+    if not rows:
+        return 0
+    if len(rows) >= COPY_THRESHOLD:
+        _copy_chunks_sync(db, rows)
+    else:
+        db.execute(insert(DocumentChunk), rows)
+    return len(rows)
+
+
+def delete_chunks_for_document_sync(db: Session, document_id: int) -> int:
+    """Delete all chunks for a document before it is re-chunked"""
+    result = db.execute(
+        delete(DocumentChunk).where(DocumentChunk.document_id == document_id)
+    )
+    return result.rowcount
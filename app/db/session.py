@@ -8,6 +8,24 @@ from sqlalchemy import create_engine
 
 from app.core.config import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(obj) -> str:
+    # OPT_NON_STR_KEYS accepts int dict keys, as json.dumps does
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON/JSONB columns (audit details, metadata) are encoded and decoded in C
+# when orjson is installed; otherwise SQLAlchemy keeps the stdlib json module
+_json_engine_kwargs = (
+    {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+    if orjson is not None else {}
+)
+
 # Async engine for main application - disable pooling to avoid transaction issues
 from sqlalchemy.pool import NullPool
 
@@ -15,12 +33,14 @@ async_engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     poolclass=NullPool,  # Disable connection pooling - create new connection each time
+    insertmanyvalues_page_size=1000,  # Batch bulk inserts (e.g. document chunks) into fewer statements
     connect_args={
         "server_settings": {
             "application_name": "indoc_app",
             "jit": "off"  # Disable JIT for faster query planning
         }
-    }
+    },
+    **_json_engine_kwargs
 )
 
 # Async session factory
@@ -36,7 +56,10 @@ AsyncSessionLocal = async_sessionmaker(
 sync_engine = create_engine(
     settings.SYNC_DATABASE_URL,
     echo=settings.DEBUG,
-    pool_pre_ping=True
+    pool_pre_ping=True,
+    pool_use_lifo=True,  # Reuse the most recently returned connection so idle ones can time out
+    insertmanyvalues_page_size=1000,
+    **_json_engine_kwargs
 )
 
 # Sync session factory
@@ -115,7 +115,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             rate_limit["window"]
         ):
             logger.warning(
-                f"Rate limit exceeded for client {client_id} on {request.url.path}"
+                "Rate limit exceeded for client %s on %s", client_id, request.url.path
             )
             
             # Return rate limit error
@@ -139,24 +139,36 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         return response
     
     def _get_client_id(self, request: Request) -> str:
-        """Get unique client identifier"""
-        # Try to get user ID from request state (if authenticated)
-        if hasattr(request.state, "user") and request.state.user:
-            return f"user:{request.state.user.id}"
-        
-        # Fall back to IP address
-        client_ip = request.client.host if request.client else "unknown"
+        """
+        Get unique client identifier
         
-        # Check for forwarded headers (reverse proxy)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
+        The result is cached on request.state.client_id so other middlewares
+        and handlers can reuse it without re-parsing the proxy headers.
+        """
+        client_id = getattr(request.state, "client_id", None)
+        if client_id:
+            return client_id
         
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            client_ip = real_ip
+        # Try to get user ID from request state (if authenticated)
+        if getattr(request.state, "user", None):
+            client_id = f"user:{request.state.user.id}"
+        else:
+            # Fall back to IP address
+            client_ip = request.client.host if request.client else "unknown"
+            
+            # Check for forwarded headers (reverse proxy)
+            forwarded_for = request.headers.get("X-Forwarded-For")
+            if forwarded_for:
+                client_ip = forwarded_for.partition(",")[0].strip()
+            
+            real_ip = request.headers.get("X-Real-IP")
+            if real_ip:
+                client_ip = real_ip
+            
+            client_id = f"ip:{client_ip}"
         
-        return f"ip:{client_ip}"
+        request.state.client_id = client_id
+        return client_id
     
     def _get_rate_limit(self, path: str) -> Dict[str, int]:
         """Get rate limit configuration for a path"""
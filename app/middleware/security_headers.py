@@ -117,6 +117,20 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             else "Content-Security-Policy"
         )
         
+        # Header values depend only on config, so build them once here
+        # rather than on every response
+        self.csp_header = self.config.get_csp_header(self.is_production)
+        self.permissions_policy = (
+            self.config.get_permissions_policy()
+            if self.config.permissions_policy_enabled
+            else None
+        )
+        self.hsts_header = (
+            f"max-age={self.config.hsts_max_age}; includeSubDomains; preload"
+            if self.config.hsts_enabled and self.is_production
+            else None
+        )
+        
         logger.info(
             f"SecurityHeadersMiddleware initialized. "
             f"CSP report-only: {self.config.csp_report_only}, "
@@ -141,18 +155,15 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         response.headers.setdefault('Referrer-Policy', 'strict-origin-when-cross-origin')
         
         # Content Security Policy
-        csp = self.config.get_csp_header(self.is_production)
-        response.headers.setdefault(self.csp_header_name, csp)
+        response.headers.setdefault(self.csp_header_name, self.csp_header)
         
         # Permissions Policy (formerly Feature-Policy)
-        if self.config.permissions_policy_enabled:
-            permissions_policy = self.config.get_permissions_policy()
-            response.headers.setdefault('Permissions-Policy', permissions_policy)
+        if self.permissions_policy:
+            response.headers.setdefault('Permissions-Policy', self.permissions_policy)
         
         # HTTP Strict Transport Security (only in production with HTTPS)
-        if self.config.hsts_enabled and self.is_production:
-            hsts_value = f"max-age={self.config.hsts_max_age}; includeSubDomains; preload"
-            response.headers.setdefault('Strict-Transport-Security', hsts_value)
+        if self.hsts_header:
+            response.headers.setdefault('Strict-Transport-Security', self.hsts_header)
         
         # Cross-Origin policies
         response.headers.setdefault('Cross-Origin-Opener-Policy', 'same-origin')
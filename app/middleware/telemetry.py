@@ -2,8 +2,9 @@
 Telemetry middleware for monitoring and observability
 """
 import time
+import asyncio
 import logging
-from typing import Callable
+from typing import Callable, Set
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -15,11 +16,23 @@ logger = logging.getLogger(__name__)
 class TelemetryMiddleware(BaseHTTPMiddleware):
     """Middleware for telemetry and monitoring"""
     
+    def __init__(self, app):
+        super().__init__(app)
+        # main.py only installs this middleware when telemetry is enabled;
+        # capture the flag once as a safety net instead of reading settings
+        # on every request
+        self._enabled = settings.ENABLE_TELEMETRY
+        
+        # Metrics are sent off the response path; bound in-flight sends so
+        # a slow backend can't grow the task set without limit
+        self._metrics_sem = asyncio.Semaphore(100)
+        self._metrics_tasks: Set[asyncio.Task] = set()
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and collect telemetry data"""
         
         # Skip if telemetry is disabled
-        if not settings.ENABLE_TELEMETRY:
+        if not self._enabled:
             return await call_next(request)
         
         start_time = time.time()
@@ -28,7 +41,7 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
         request_id = request.headers.get("X-Request-ID", str(time.time()))
         
         # Log request start
-        logger.info(f"Request started: {request.method} {request.url.path} [ID: {request_id}]")
+        logger.info("Request started: %s %s [ID: %s]", request.method, request.url.path, request_id)
         
         try:
             # Process request
@@ -43,13 +56,13 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
             
             # Log request completion
             logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"[ID: {request_id}] [Status: {response.status_code}] "
-                f"[Duration: {round(duration * 1000, 2)}ms]"
+                "Request completed: %s %s [ID: %s] [Status: %d] [Duration: %.2fms]",
+                request.method, request.url.path, request_id,
+                response.status_code, duration * 1000
             )
             
             # Send metrics to monitoring service (if configured)
-            await self._send_metrics(
+            self._schedule_metrics(
                 method=request.method,
                 path=request.url.path,
                 status_code=response.status_code,
@@ -64,13 +77,12 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
             
             # Log error
             logger.error(
-                f"Request failed: {request.method} {request.url.path} "
-                f"[ID: {request_id}] [Error: {str(e)}] "
-                f"[Duration: {round(duration * 1000, 2)}ms]"
+                "Request failed: %s %s [ID: %s] [Error: %s] [Duration: %.2fms]",
+                request.method, request.url.path, request_id, e, duration * 1000
             )
             
             # Send error metrics
-            await self._send_metrics(
+            self._schedule_metrics(
                 method=request.method,
                 path=request.url.path,
                 status_code=500,
@@ -81,6 +93,25 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
             
             raise
     
+    def _schedule_metrics(self, **metrics) -> None:
+        """Send metrics in a detached task so the response isn't delayed"""
+        if self._metrics_sem.locked():
+            logger.debug("Metrics backlog full, dropping metrics for %s", metrics.get("request_id"))
+            return
+        
+        task = asyncio.create_task(self._send_metrics_bounded(**metrics))
+        # Keep a strong reference until the task finishes
+        self._metrics_tasks.add(task)
+        task.add_done_callback(self._metrics_tasks.discard)
+    
+    async def _send_metrics_bounded(self, **metrics) -> None:
+        """Run _send_metrics under the in-flight limit, swallowing errors"""
+        async with self._metrics_sem:
+            try:
+                await self._send_metrics(**metrics)
+            except Exception as e:
+                logger.debug("Failed to send metrics: %s", e)
+    
     async def _send_metrics(
         self,
         method: str,
@@ -107,9 +138,9 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
         
         # Log metrics for now
         if error:
-            logger.debug(f"Error metrics: {metrics}")
+            logger.debug("Error metrics: %s", metrics)
         else:
-            logger.debug(f"Request metrics: {metrics}")
+            logger.debug("Request metrics: %s", metrics)
         
         # TODO: Implement actual metrics sending
         # Example integrations:
@@ -2,11 +2,53 @@
 Base model for all database models
 """
 from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import CHAR, DateTime as _DateTime
 
 Base = declarative_base()
 
 
+class gen_random_uuid(FunctionElement):
+    """Server-side random UUID, for server_default on GUID columns"""
+    type = CHAR(36)
+    inherit_cache = True
+
+
+@compiles(gen_random_uuid, 'postgresql')
+def _pg_gen_random_uuid(element, compiler, **kw):
+    return "gen_random_uuid()"
+
+
+@compiles(gen_random_uuid, 'sqlite')
+def _sqlite_gen_random_uuid(element, compiler, **kw):
+    # Hyphenated version-4 layout, matching what GUID stores as CHAR(36)
+    return (
+        "lower(hex(randomblob(4))) || '-' || lower(hex(randomblob(2))) || '-4' || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+        "substr(lower(hex(randomblob(2))), 2) || '-' || lower(hex(randomblob(6)))"
+    )
+
+
+class utcnow(FunctionElement):
+    """Current time as naive UTC, evaluated by the database"""
+    type = _DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+@compiles(utcnow, 'sqlite')
+def _sqlite_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
 class BaseModel(Base):
     """Base model with common fields"""
     __abstract__ = True
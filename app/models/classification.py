@@ -2,6 +2,7 @@
 Document classification enum for ABAC (Attribute-Based Access Control)
 """
 import enum
+from typing import List
 
 
 class DocumentClassification(str, enum.Enum):
@@ -13,6 +14,8 @@ class DocumentClassification(str, enum.Enum):
     - RESTRICTED: Manager+ only
     - CONFIDENTIAL: Admin only
     """
+    # Declaration order is the hierarchy level and the stored SMALLINT code
+    # (see SmallIntEnum) - only ever append new levels
     PUBLIC = "PUBLIC"
     INTERNAL = "INTERNAL"
     RESTRICTED = "RESTRICTED"
@@ -59,5 +62,10 @@ class DocumentClassification(str, enum.Enum):
         
         # Default: only Public
         return doc_classification == cls.PUBLIC
+    
+    @classmethod
+    def accessible_levels(cls, user_role: str) -> List["DocumentClassification"]:
+        """Classifications a role can access, for filtering in SQL with IN (...)"""
+        return [level for level in cls if cls.can_access(user_role, level)]
 
 
@@ -2,26 +2,47 @@
 Conversation models for document chat functionality
 """
 from sqlalchemy import Column, String, Text, ForeignKey, DateTime, JSON, Integer
-from app.core.types import GUID
+from app.core.types import GUID, GUIDArray
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.sql.expression import FunctionElement
 import uuid
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, gen_random_uuid, utcnow
+
+
+class _empty_guid_array(FunctionElement):
+    """Empty-list server default for GUIDArray columns"""
+    inherit_cache = True
+
+
+@compiles(_empty_guid_array)
+def _compile_empty_guid_array(element, compiler, **kw):
+    return "'[]'"
+
+
+@compiles(_empty_guid_array, 'postgresql')
+def _pg_empty_guid_array(element, compiler, **kw):
+    return "'{}'"
 
 
 class Conversation(BaseModel):
     """Conversation model for document chat sessions"""
     __tablename__ = "conversations"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4, server_default=gen_random_uuid())
     tenant_id = Column(GUID(), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     document_id = Column(Integer, ForeignKey("documents.id"), nullable=True)
     title = Column(String(255))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     conversation_metadata = Column(JSON, default={})
+    # UUIDs of the documents the conversation is scoped to
+    document_ids = Column(GUIDArray(), nullable=False, default=list, server_default=_empty_guid_array())
+    
+    # Fetch server-generated timestamps with RETURNING at flush time
+    __mapper_args__ = {"eager_defaults": True}
     
     # Relationships
     user = relationship("User", back_populates="conversations")
@@ -33,12 +54,14 @@ class Message(BaseModel):
     """Message model for conversation messages"""
     __tablename__ = "messages"
 
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID(), primary_key=True, default=uuid.uuid4, server_default=gen_random_uuid())
     conversation_id = Column(GUID(), ForeignKey("conversations.id"), nullable=False)
     role = Column(String(20), nullable=False)  # 'user' or 'assistant'
     content = Column(Text, nullable=False)
     message_metadata = Column(JSON, default={})
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    
+    __mapper_args__ = {"eager_defaults": True}
     
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
\ No newline at end of file
@@ -1,20 +1,38 @@
 """
 Document and DocumentChunk models
 """
-from sqlalchemy import Column, String, Integer, Float, Text, Boolean, ForeignKey, JSON, LargeBinary, Enum
-from sqlalchemy.orm import relationship
-from app.core.types import GUID
+from sqlalchemy import Column, String, Integer, Float, Text, Boolean, ForeignKey, JSON, CheckConstraint, Index, text
+from sqlalchemy.orm import relationship, deferred
+from pgvector.sqlalchemy import HALFVEC
+from app.core.types import GUID, PGComputed, SmallIntEnum, TSVector
 import uuid
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, gen_random_uuid
 from app.models.classification import DocumentClassification
 
+# Must match the embedding model / QDRANT_VECTOR_SIZE (all-MiniLM-L6-v2 = 384)
+EMBEDDING_DIMENSION = 384
+
 
 class Document(BaseModel):
     __tablename__ = "documents"
+    __table_args__ = (
+        CheckConstraint('classification BETWEEN 0 AND 3', name='ck_documents_classification'),
+        # "My documents" listings filter on all three; filename/created_at ride
+        # along so the listing can be an index-only scan. tenant_id leads, so
+        # this also serves tenant-only filters.
+        Index(
+            'idx_documents_tenant_uploader_status',
+            'tenant_id', 'uploaded_by', 'status',
+            postgresql_include=['filename', 'created_at']
+        ),
+        Index('idx_documents_fts', 'full_text_tsv', postgresql_using='gin'),
+    )
     
     # Basic info
-    uuid = Column(GUID(), default=uuid.uuid4, unique=True, index=True)
+    # Python default keeps uuid available before flush; the server default
+    # covers Core/bulk inserts that bypass the ORM
+    uuid = Column(GUID(), default=uuid.uuid4, server_default=gen_random_uuid(), unique=True, index=True)
     filename = Column(String(255), nullable=False)
     file_type = Column(String(50), nullable=False)
     file_size = Column(Integer, nullable=False)
@@ -40,7 +58,13 @@ class Document(BaseModel):
     document_set_id = Column(String(100), nullable=True, index=True)  # For grouping related documents
     
     # Extracted content
-    full_text = Column(Text)
+    # Deferred: can be megabytes, so only loaded on access or with
+    # undefer(Document.full_text). Async queries that read it must undefer.
+    full_text = deferred(Column(Text))
+    full_text_tsv = deferred(Column(
+        TSVector(),
+        PGComputed("to_tsvector('english', coalesce(full_text, ''))", persisted=True)
+    ))
     extracted_data = Column(JSON)  # Structured data from forms/tables
     language = Column(String(10))
     
@@ -52,14 +76,18 @@ class Document(BaseModel):
     encrypted_fields = Column(JSON, default=list)  # List of encrypted field names
     access_level = Column(String(50), default="private")  # Legacy field (deprecated)
     classification = Column(
-        Enum(DocumentClassification),
+        SmallIntEnum(DocumentClassification),  # 0=PUBLIC .. 3=CONFIDENTIAL
         default=DocumentClassification.INTERNAL,
+        server_default=text("1"),
         nullable=False,
         index=True
     )  # ABAC classification level
     
     # Multi-tenancy  
-    tenant_id = Column(GUID(), nullable=True, index=True)
+    # Not hash-partitioned on tenant_id: the PK, the global uuid unique key and
+    # every FK into documents would have to include it, and it is still
+    # nullable for legacy rows. Tenant scans use idx_documents_tenant_uploader_status.
+    tenant_id = Column(GUID(), nullable=True)
     
     # User relationship
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -88,7 +116,8 @@ class DocumentChunk(BaseModel):
     end_char = Column(Integer)
     
     # Embeddings
-    embedding_vector = Column(LargeBinary)  # Stored as binary
+    # fp16 halves storage/index size and memory bandwidth for similarity scans
+    embedding_vector = Column(HALFVEC(EMBEDDING_DIMENSION))
     embedding_model = Column(String(100))
     
     # Search scores
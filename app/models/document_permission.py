@@ -1,7 +1,7 @@
 """
 Document permission model for fine-grained access control
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
@@ -33,6 +33,13 @@ class DocumentPermission(Base):
     granter = relationship("User", foreign_keys=[granted_by])
     
     __table_args__ = (
+        # Covers the access check (user, document, type + expiry) and the
+        # per-user listing as index-only scans
+        Index(
+            'idx_docperm_user_doc_perm',
+            'user_id', 'document_id', 'permission_type',
+            postgresql_include=['expires_at']
+        ),
         {'extend_existing': True}
     )
 
@@ -1,7 +1,7 @@
 """
 RBAC Models: Role, Permission, and junction tables
 """
-from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, DateTime, Text, func, UniqueConstraint, Table
+from sqlalchemy import Column, String, Boolean, Integer, ForeignKey, DateTime, Text, func, UniqueConstraint, Table, Index
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel, Base
 
@@ -71,6 +71,8 @@ class UserRole(BaseModel):
     # Unique constraint: user can't have same role twice
     __table_args__ = (
         UniqueConstraint('user_id', 'role_id', name='uq_user_role'),
+        # Lets the active-role lookup filter on expires_at inside the index
+        Index('idx_user_roles_user_expires', 'user_id', 'expires_at'),
     )
     
     def __repr__(self):
@@ -92,7 +94,7 @@ class RolePermission(BaseModel):
     
     # Relationships
     role = relationship("Role", back_populates="role_permissions")
-    permission = relationship("Permission", back_populates="role_permissions")
+    permission = relationship("Permission", back_populates="role_permissions", lazy="joined")
     granter = relationship("User", foreign_keys=[granted_by])
     
     # Unique constraint: role can't have same permission twice
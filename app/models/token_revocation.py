@@ -1,7 +1,7 @@
 """
 Token revocation model for JWT blacklist
 """
-from sqlalchemy import Column, String, Index, Integer, ForeignKey
+from sqlalchemy import Column, String, Index, Integer, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
 
 from app.models.base import BaseModel
@@ -22,7 +22,7 @@ class RevokedToken(BaseModel):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     token_type = Column(String(20), nullable=False)  # "access" or "refresh"
     reason = Column(String(100), nullable=True)  # "logout", "password_change", "role_change", "manual_revoke"
-    expires_at = Column(String(50), nullable=False)  # ISO timestamp when token naturally expires
+    expires_at = Column(DateTime(timezone=True), nullable=False)  # When the token naturally expires
     
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
@@ -1,13 +1,17 @@
 """
 User model with RBAC support
 """
-from sqlalchemy import Column, String, Boolean, ForeignKey, Integer
+from datetime import datetime, timezone
+from typing import List, Set
+from sqlalchemy import Column, String, Boolean, ForeignKey, Integer, select, or_, func, event
 from sqlalchemy.types import Enum as SQLAlchemyEnum
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.types import GUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, object_session, selectinload
 import enum
 
 from app.models.base import BaseModel
+from app.models.role import Role, Permission, RolePermission, UserRole as UserRoleModel
 
 
 class UserRole(str, enum.Enum):
@@ -77,29 +81,140 @@ class User(BaseModel):
     # storage_quota = relationship("UserStorageQuota", back_populates="user", uselist=False)  # TODO: Fix import
     
     # RBAC Helper Methods
+    @staticmethod
+    def _active_role_filter(user_id: int):
+        """WHERE clauses selecting a user's active, non-expired role assignments"""
+        return (
+            UserRoleModel.user_id == user_id,
+            Role.is_active.is_(True),
+            or_(UserRoleModel.expires_at.is_(None), UserRoleModel.expires_at > func.now())
+        )
+    
+    @classmethod
+    def rbac_loader_options(cls):
+        """Loader options that fetch the role/permission graph for permission checks"""
+        return (
+            selectinload(cls.user_roles)
+            .selectinload(UserRoleModel.role)
+            .selectinload(Role.role_permissions),
+        )
+    
+    @classmethod
+    def roles_query(cls, user_id: int):
+        """Build a SELECT returning a user's active roles, expiry filtered in SQL"""
+        return (
+            select(Role)
+            .join(UserRoleModel, UserRoleModel.role_id == Role.id)
+            .where(*cls._active_role_filter(user_id))
+        )
+    
+    @classmethod
+    def permissions_query(cls, user_id: int):
+        """Build a single SELECT returning the names of a user's active permissions"""
+        return (
+            select(Permission.name)
+            .join(RolePermission, RolePermission.permission_id == Permission.id)
+            .join(Role, Role.id == RolePermission.role_id)
+            .join(UserRoleModel, UserRoleModel.role_id == Role.id)
+            .where(*cls._active_role_filter(user_id))
+            .distinct()
+        )
+    
+    @classmethod
+    async def get_roles_for(cls, session: AsyncSession, user_id: int) -> List[Role]:
+        """Get all active roles for a user in one round trip"""
+        result = await session.execute(cls.roles_query(user_id))
+        return list(result.scalars().all())
+    
+    @classmethod
+    async def get_permissions_for(cls, session: AsyncSession, user_id: int) -> Set[str]:
+        """Get all permission names for a user in one round trip"""
+        result = await session.execute(cls.permissions_query(user_id))
+        return set(result.scalars().all())
+    
+    def _sync_session(self):
+        """Return the owning session if it can run queries synchronously"""
+        session = object_session(self)
+        if session is not None and not session.get_bind().dialect.is_async:
+            return session
+        return None
+    
+    def clear_rbac_cache(self) -> None:
+        """Drop memoized roles/permissions (called on expire/refresh)"""
+        self.__dict__.pop("_roles_cache", None)
+        self.__dict__.pop("_role_names_cache", None)
+        self.__dict__.pop("_perm_cache", None)
+    
+    def prime_rbac_cache(self, role_names, permissions) -> None:
+        """Seed the memoized role names/permissions (e.g. from Redis)"""
+        self.__dict__["_role_names_cache"] = set(role_names)
+        self.__dict__["_perm_cache"] = set(permissions)
+    
     def get_roles(self):
         """Get all active roles for this user"""
-        from datetime import datetime
-        return [
-            ur.role for ur in self.user_roles
-            if ur.role.is_active and (ur.expires_at is None or ur.expires_at > datetime.now())
-        ]
+        # Memoized on the instance (outside SQLAlchemy instrumentation) so the
+        # several checks an endpoint makes don't each rebuild the list
+        roles = self.__dict__.get("_roles_cache")
+        if roles is None:
+            session = self._sync_session()
+            if session is not None:
+                roles = list(session.execute(self.roles_query(self.id)).scalars().all())
+            else:
+                # expires_at is timezone-aware, so compare against aware UTC now
+                now = datetime.now(timezone.utc)
+                roles = [
+                    ur.role for ur in self.user_roles
+                    if ur.role.is_active and (ur.expires_at is None or ur.expires_at > now)
+                ]
+            self.__dict__["_roles_cache"] = roles
+        return roles
     
     def get_permissions(self):
         """Get all permissions from all user's roles"""
-        permissions = set()
-        for role in self.get_roles():
-            for rp in role.role_permissions:
-                permissions.add(rp.permission.name)
+        permissions = self.__dict__.get("_perm_cache")
+        if permissions is not None:
+            return permissions
+        
+        # Sync sessions can run the set query directly; async sessions can't
+        # do I/O from here, so fall back to the relationships loaded with
+        # rbac_loader_options()
+        session = self._sync_session()
+        if session is not None:
+            permissions = set(session.execute(self.permissions_query(self.id)).scalars().all())
+        else:
+            permissions = set()
+            for role in self.get_roles():
+                for rp in role.role_permissions:
+                    permissions.add(rp.permission.name)
+        
+        self.__dict__["_perm_cache"] = permissions
         return permissions
     
     def has_permission(self, permission_name: str) -> bool:
         """Check if user has a specific permission"""
         # Admin has wildcard access
-        if any(role.name == 'admin' for role in self.get_roles()):
+        if self.has_role('admin'):
             return True
         return permission_name in self.get_permissions()
     
+    def get_role_names(self) -> Set[str]:
+        """Get the names of all active roles for this user"""
+        names = self.__dict__.get("_role_names_cache")
+        if names is None:
+            names = {role.name for role in self.get_roles()}
+            self.__dict__["_role_names_cache"] = names
+        return names
+    
     def has_role(self, role_name: str) -> bool:
         """Check if user has a specific role"""
-        return any(role.name == role_name for role in self.get_roles())
\ No newline at end of file
+        return role_name in self.get_role_names()
+
+
+@event.listens_for(User, "expire")
+def _clear_rbac_cache_on_expire(target, attrs):
+    target.clear_rbac_cache()
+
+
+@event.listens_for(User, "refresh")
+def _clear_rbac_cache_on_refresh(target, context, attrs):
+    target.clear_rbac_cache()
@@ -1,9 +1,11 @@
 """
 User storage quota and usage tracking models
 """
-from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, JSON, BigInteger
+from sqlalchemy import Column, String, Integer, Float, Boolean, ForeignKey, DateTime, JSON, BigInteger, func
 from sqlalchemy.orm import relationship
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
 from app.models.base import BaseModel
 from app.core.types import GUID
 
@@ -81,7 +83,7 @@ class ConversationRetention(BaseModel):
     is_deleted = Column(Boolean, default=False)
     
     # Timestamps
-    last_accessed_at = Column(DateTime, default=datetime.utcnow)
+    last_accessed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     archived_at = Column(DateTime, nullable=True)
     scheduled_deletion_at = Column(DateTime, nullable=True)
     
@@ -100,37 +102,48 @@ class ConversationRetention(BaseModel):
 
 
 # Storage tiers configuration
-STORAGE_TIERS = {
-    "free": {
-        "conversation_storage": 10 * 1024 * 1024,  # 10MB
-        "document_storage": 100 * 1024 * 1024,  # 100MB
-        "conversation_retention": 30,  # 30 days
-        "max_conversations": 10,
-        "max_messages_per_conversation": 100,
-        "monthly_fee": 0.0
-    },
-    "basic": {
-        "conversation_storage": 100 * 1024 * 1024,  # 100MB
-        "document_storage": 1 * 1024 * 1024 * 1024,  # 1GB
-        "conversation_retention": 90,  # 90 days
-        "max_conversations": 100,
-        "max_messages_per_conversation": 1000,
-        "monthly_fee": 9.99
-    },
-    "pro": {
-        "conversation_storage": 1 * 1024 * 1024 * 1024,  # 1GB
-        "document_storage": 10 * 1024 * 1024 * 1024,  # 10GB
-        "conversation_retention": 365,  # 1 year
-        "max_conversations": 1000,
-        "max_messages_per_conversation": 10000,
-        "monthly_fee": 29.99
-    },
-    "enterprise": {
-        "conversation_storage": 10 * 1024 * 1024 * 1024,  # 10GB
-        "document_storage": 100 * 1024 * 1024 * 1024,  # 100GB
-        "conversation_retention": -1,  # Unlimited
-        "max_conversations": -1,  # Unlimited
-        "max_messages_per_conversation": -1,  # Unlimited
-        "monthly_fee": 99.99
-    }
-}
+@dataclass(frozen=True, slots=True)
+class TierLimits:
+    """Limits and pricing for a storage tier (-1 means unlimited)"""
+    conversation_storage: int  # bytes
+    document_storage: int  # bytes
+    conversation_retention: int  # days
+    max_conversations: int
+    max_messages_per_conversation: int
+    monthly_fee: float
+
+
+STORAGE_TIERS: Mapping[str, TierLimits] = MappingProxyType({
+    "free": TierLimits(
+        conversation_storage=10_485_760,  # 10MB
+        document_storage=104_857_600,  # 100MB
+        conversation_retention=30,  # 30 days
+        max_conversations=10,
+        max_messages_per_conversation=100,
+        monthly_fee=0.0
+    ),
+    "basic": TierLimits(
+        conversation_storage=104_857_600,  # 100MB
+        document_storage=1_073_741_824,  # 1GB
+        conversation_retention=90,  # 90 days
+        max_conversations=100,
+        max_messages_per_conversation=1000,
+        monthly_fee=9.99
+    ),
+    "pro": TierLimits(
+        conversation_storage=1_073_741_824,  # 1GB
+        document_storage=10_737_418_240,  # 10GB
+        conversation_retention=365,  # 1 year
+        max_conversations=1000,
+        max_messages_per_conversation=10000,
+        monthly_fee=29.99
+    ),
+    "enterprise": TierLimits(
+        conversation_storage=10_737_418_240,  # 10GB
+        document_storage=107_374_182_400,  # 100GB
+        conversation_retention=-1,  # Unlimited
+        max_conversations=-1,  # Unlimited
+        max_messages_per_conversation=-1,  # Unlimited
+        monthly_fee=99.99
+    ),
+})
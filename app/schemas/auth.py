@@ -7,7 +7,17 @@ import re
 from datetime import datetime
 
 
+# Allow .local domains for development (EmailStr would reject them)
+_EMAIL_RE = re.compile(
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$|^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.local$'
+)
+
+
 class Token(BaseModel):
+    # Built only from values we mint (JWT strings, literal flags): strict mode
+    # skips lax coercion, frozen makes instances hashable
+    model_config = ConfigDict(strict=True, frozen=True)
+    
     access_token: str
     token_type: str = "bearer"
     mfa_required: bool = False  # Indicates if MFA verification is pending
@@ -15,6 +25,8 @@ class Token(BaseModel):
 
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(strict=True, frozen=True)
+    
     username: Optional[str] = None
 
 
@@ -26,9 +38,7 @@ class UserBase(BaseModel):
     @field_validator('email')
     @classmethod
     def validate_email(cls, v):
-        # Allow .local domains for development
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$|^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.local$'
-        if not re.match(email_pattern, v):
+        if not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
         return v
 
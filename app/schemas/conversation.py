@@ -3,7 +3,7 @@ Pydantic schemas for conversation functionality
 """
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, StringConstraints
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict, StringConstraints, TypeAdapter
 from typing import Annotated
 from uuid import UUID
 
@@ -29,21 +29,14 @@ class MessageResponse(BaseModel):
     conversation_id: UUID
     role: RoleStr
     content: str
-    metadata: Dict[str, Any] = Field(default_factory=dict, alias="message_metadata")
+    # message_metadata must be tried first: ORM rows also expose SQLAlchemy's
+    # MetaData object as .metadata
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("message_metadata", "metadata")
+    )
     created_at: datetime
 
-    @classmethod
-    def from_orm(cls, obj):
-        """Custom from_orm to handle message_metadata field"""
-        return cls(
-            id=obj.id,
-            conversation_id=obj.conversation_id,
-            role=obj.role,
-            content=obj.content,
-            metadata=obj.message_metadata if hasattr(obj, 'message_metadata') else {},
-            created_at=obj.created_at
-        )
-
 
 class ConversationBase(BaseModel):
     """Base conversation schema"""
@@ -71,9 +64,16 @@ class ConversationResponse(ConversationBase):
     user_id: int
     created_at: datetime
     updated_at: datetime
+    document_ids: List[UUID] = Field(default_factory=list)
     messages: List[MessageResponse] = Field(default_factory=list)
 
 
+# Module-level adapters: the list schema is built once and whole lists of ORM
+# rows are validated in a single core call instead of per-item model_validate
+MESSAGE_LIST_ADAPTER = TypeAdapter(List[MessageResponse])
+CONVERSATION_LIST_ADAPTER = TypeAdapter(List[ConversationResponse])
+
+
 class ConversationListResponse(BaseModel):
     """Schema for listing conversations"""
     conversations: List[ConversationResponse]
@@ -1,72 +1,144 @@
 """
 User schemas for request/response validation
 """
-from typing import Optional, List
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, get_args
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field, validator
-from enum import Enum
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+import emval
 
 
-class UserRoleEnum(str, Enum):
-    Admin = "Admin"
-    Manager = "Manager"
-    Analyst = "Analyst"
-    Reviewer = "Reviewer"
-    Uploader = "Uploader"
-    Viewer = "Viewer"
-    Compliance = "Compliance"
+# Built once; each call is a single call into emval's Rust validator.
+# No DNS lookups, matching EmailStr's behaviour.
+_EMAIL_VALIDATOR = emval.EmailValidator(
+    allow_smtputf8=True,
+    allow_empty_local=False,
+    allow_quoted_local=False,
+    allow_domain_literal=False,
+    deliverable_address=False,
+)
+
+
+def _normalize_email(v: str) -> str:
+    try:
+        return _EMAIL_VALIDATOR.validate_email(v).normalized
+    except (SyntaxError, ValueError) as e:
+        raise ValueError(f'Invalid email address: {e}')
+
+
+FastEmailStr = Annotated[str, AfterValidator(_normalize_email)]
+
+# Shared string field types, reused across the create/update models
+Username = Annotated[str, StringConstraints(min_length=3, max_length=50)]
+FullName = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+ShortText = Annotated[str, StringConstraints(max_length=100)]
+Phone = Annotated[str, StringConstraints(max_length=20)]
+
+
+# Password character classes, accumulated as a bitmask
+_UPPER, _LOWER, _DIGIT = 1, 2, 4
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT
+_PASSWORD_CLASS_ERRORS = (
+    (_UPPER, 'Password must contain at least one uppercase letter'),
+    (_LOWER, 'Password must contain at least one lowercase letter'),
+    (_DIGIT, 'Password must contain at least one digit'),
+)
+
+
+def _check_password_strength(v: str) -> str:
+    # Length is enforced by StringConstraints; classify characters in a
+    # single pass and stop as soon as every class has been seen
+    flags = 0
+    for c in v:
+        if c.isupper():
+            flags |= _UPPER
+        elif c.islower():
+            flags |= _LOWER
+        elif c.isdigit():
+            flags |= _DIGIT
+        if flags == _ALL_CLASSES:
+            return v
+    for flag, message in _PASSWORD_CLASS_ERRORS:
+        if not flags & flag:
+            raise ValueError(message)
+    return v
+
+
+# Every field that sets a password shares these rules
+StrongPassword = Annotated[
+    str,
+    StringConstraints(min_length=8, max_length=100),
+    AfterValidator(_check_password_strength),
+]
+
+
+# Role names (values of app.models.user.UserRole). A Literal validates as a
+# string-set lookup in pydantic-core and serializes as a plain string.
+UserRoleName = Literal["Admin", "Manager", "Analyst", "Reviewer", "Uploader", "Viewer", "Compliance"]
+USER_ROLES: Tuple[UserRoleName, ...] = get_args(UserRoleName)
+
+
+class _ORMModel(BaseModel):
+    """Base for schemas read from ORM objects"""
+    model_config = ConfigDict(from_attributes=True, extra='ignore')
+
+
+class _InputModel(BaseModel):
+    """Base for strict request bodies: unknown keys are rejected, not dropped"""
+    model_config = ConfigDict(extra='forbid')
 
 
 class UserBase(BaseModel):
-    email: EmailStr
-    username: str = Field(..., min_length=3, max_length=50)
-    full_name: str = Field(..., min_length=1, max_length=100)
-    role: UserRoleEnum = UserRoleEnum.Analyst
-    department: Optional[str] = Field(None, max_length=100)
-    phone: Optional[str] = Field(None, max_length=20)
-    location: Optional[str] = Field(None, max_length=100)
+    email: FastEmailStr
+    username: Username
+    full_name: FullName
+    role: UserRoleName = "Analyst"
+    department: Optional[ShortText] = None
+    phone: Optional[Phone] = None
+    location: Optional[ShortText] = None
 
 
 class UserCreate(UserBase):
-    password: str = Field(..., min_length=8, max_length=100)
+    password: StrongPassword
     is_active: bool = True
-    
-    @validator('password')
-    def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not any(c.isupper() for c in v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not any(c.islower() for c in v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
-
-
-class UserUpdate(BaseModel):
-    email: Optional[EmailStr] = None
-    username: Optional[str] = Field(None, min_length=3, max_length=50)
-    full_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    role: Optional[UserRoleEnum] = None
-    department: Optional[str] = Field(None, max_length=100)
-    phone: Optional[str] = Field(None, max_length=20)
-    location: Optional[str] = Field(None, max_length=100)
-    password: Optional[str] = Field(None, min_length=8, max_length=100)
+
+
+class UserProfileUpdate(_InputModel):
+    """Self-service profile fields"""
+    email: Optional[FastEmailStr] = None
+    username: Optional[Username] = None
+    full_name: Optional[FullName] = None
+    department: Optional[ShortText] = None
+    phone: Optional[Phone] = None
+    location: Optional[ShortText] = None
+
+
+class UserAdminUpdate(_InputModel):
+    """Account fields managed by administrators"""
+    role: Optional[UserRoleName] = None
     is_active: Optional[bool] = None
     is_verified: Optional[bool] = None
     manager_id: Optional[int] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class UserResponse(BaseModel):
+class UserPasswordUpdate(_InputModel):
+    password: Optional[StrongPassword] = None
+
+
+class UserUpdate(UserProfileUpdate, UserAdminUpdate, UserPasswordUpdate):
+    """Combined update body, as sent by the user management form"""
+    pass
+
+
+class UserResponse(_ORMModel):
+    model_config = ConfigDict(frozen=True)
+    
     id: int
     email: str
     username: str
     full_name: Optional[str] = None
-    role: str
+    # ORM roles (app.models.user.UserRole) are str enums with these values, so
+    # they match the Literal directly and are emitted as plain strings
+    role: UserRoleName
     is_active: bool
     is_verified: bool
     created_at: Optional[datetime] = None
@@ -75,34 +147,44 @@ class UserResponse(BaseModel):
     phone: Optional[str] = None
     location: Optional[str] = None
     
-    class Config:
-        from_attributes = True
-        from_attributes = True
-        
-    @validator('role', pre=True)
-    def convert_role(cls, v):
-        if hasattr(v, 'value'):
-            return v.value
-        return v
-
-
-class UserListResponse(BaseModel):
+    @classmethod
+    def from_orm_fast(cls, user) -> "UserResponse":
+        """Build from a trusted ORM row without running validation"""
+        role = user.role
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=getattr(role, "value", role),
+            is_active=user.is_active,
+            is_verified=user.is_verified,
+            created_at=user.created_at,
+            manager_id=user.manager_id,
+            department=user.department,
+            phone=user.phone,
+            location=user.location,
+        )
+
+
+# Built once at import; validates/serializes user lists in a single core call
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+
+
+class UserListResponse(_ORMModel):
     users: List[UserResponse]
     total: int
     page: int = 1
     per_page: int = 25
-    
-    class Config:
-        from_attributes = True
 
 
 class PasswordReset(BaseModel):
-    email: EmailStr
+    email: FastEmailStr
 
 
 class PasswordResetConfirm(BaseModel):
     token: str
-    new_password: str = Field(..., min_length=8, max_length=100)
+    new_password: StrongPassword
 
 
 class UserStatusUpdate(BaseModel):
@@ -112,21 +194,26 @@ class UserStatusUpdate(BaseModel):
 class UserLogin(BaseModel):
     username: str  # Can be email or username
     password: str
+    
+    def is_email(self) -> bool:
+        """Cheap check for callers that only need to normalize email logins"""
+        return '@' in self.username
 
 
 class Token(BaseModel):
+    model_config = ConfigDict(strict=True, frozen=True)
+    
     access_token: str
     token_type: str = "bearer"
 
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(strict=True, frozen=True)
+    
     username: Optional[str] = None
 
 
 class UserMe(UserResponse):
     """Extended user response for current user"""
-    permissions: Optional[List[str]] = []
-    settings: Optional[dict] = {}
-    
-    class Config:
-        from_attributes = True
+    permissions: Tuple[str, ...] = ()
+    settings: Dict[str, Any] = Field(default_factory=dict)
@@ -10,8 +10,12 @@ This service ensures that document deletion is atomic across:
 
 If ANY step fails, the entire operation is rolled back.
 """
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import tempfile
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 from uuid import UUID
@@ -22,10 +26,30 @@ from app.models.document import Document
 from app.models.audit import AuditLog
 from app.services.search.elasticsearch_service import ElasticsearchService
 from app.services.search.qdrant_service import QdrantService
+from app.services.storage.base import build_object_key
 from app.services.storage.factory import get_primary_storage, get_secondary_storage
 
 logger = logging.getLogger(__name__)
 
+# Each remote storage check downloads the whole object, so bulk PREPARE
+# caps how many run at once
+REMOTE_CHECK_CONCURRENCY = 4
+
+
+def _utc_timestamp() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _record_phase(deletion_audit: Dict[str, Any], phase: str) -> str:
+    """Append a successful phase to the audit trail; returns its timestamp"""
+    timestamp = _utc_timestamp()
+    deletion_audit["phases"].append({
+        "phase": phase,
+        "status": "success",
+        "timestamp": timestamp
+    })
+    return timestamp
+
 
 class DeletionPhase:
     """Represents a single phase in the 2-phase commit deletion"""
@@ -85,7 +109,7 @@ class AtomicDeletionService:
             "document_uuid": str(document.uuid),
             "document_id": document.id,
             "filename": document.filename,
-            "initiated_at": datetime.utcnow().isoformat(),
+            "initiated_at": _utc_timestamp(),
             "user_id": user_id,
             "user_email": user_email,
             "phases": []
@@ -95,32 +119,19 @@ class AtomicDeletionService:
             # PHASE 1: PREPARE - Capture current state for rollback
             logger.info(f"📋 PHASE 1: Preparing deletion (capturing rollback data)...")
             await self._prepare_deletion(document)
-            deletion_audit["phases"].append({
-                "phase": "prepare",
-                "status": "success",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            _record_phase(deletion_audit, "prepare")
             
             # PHASE 2: COMMIT - Execute deletions
             logger.info(f"🗑️  PHASE 2: Committing deletion (removing from all systems)...")
             await self._commit_deletion(document)
-            deletion_audit["phases"].append({
-                "phase": "commit",
-                "status": "success",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+            _record_phase(deletion_audit, "commit")
             
             # PHASE 3: FINALIZE - Create audit log and remove from DB
             logger.info(f"✅ PHASE 3: Finalizing deletion (audit log and DB cleanup)...")
             await self._finalize_deletion(document, user_id, user_email, user_role)
-            deletion_audit["phases"].append({
-                "phase": "finalize",
-                "status": "success",
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
+            # The last phase boundary is also the completion time
             deletion_audit["status"] = "success"
-            deletion_audit["completed_at"] = datetime.utcnow().isoformat()
+            deletion_audit["completed_at"] = _record_phase(deletion_audit, "finalize")
             
             logger.info(f"✅ Atomic deletion completed successfully for {document.filename}")
             
@@ -135,7 +146,7 @@ class AtomicDeletionService:
             logger.error(f"❌ Atomic deletion FAILED for {document.filename}: {e}")
             deletion_audit["status"] = "failed"
             deletion_audit["error"] = str(e)
-            deletion_audit["failed_at"] = datetime.utcnow().isoformat()
+            deletion_audit["failed_at"] = _utc_timestamp()
             
             # ROLLBACK: Restore document to all systems
             logger.warning(f"🔄 Initiating ROLLBACK for document {document.filename}...")
@@ -168,6 +179,132 @@ class AtomicDeletionService:
             
             # Re-raise the original error
             raise Exception(f"Atomic deletion failed: {str(e)}") from e
+        
+        finally:
+            self._discard_spooled_objects()
+    
+    async def delete_documents_atomic(
+        self,
+        documents: List[Document],
+        user_id: int,
+        user_email: str,
+        user_role: str
+    ) -> Dict[str, Any]:
+        """
+        Atomically delete several already-validated documents.
+        
+        Same phases as delete_document_atomic, but each backend is reached
+        once for the whole batch (ES _bulk/mget, one Qdrant call, one DB
+        commit) instead of once per document. Either every document is
+        removed or the batch is rolled back.
+        
+        Returns:
+            Dict with deletion status and audit trail
+            
+        Raises:
+            Exception if deletion cannot be completed atomically
+        """
+        logger.info(f"🔄 Starting atomic deletion for {len(documents)} documents")
+        
+        deletion_audit = {
+            "document_uuids": [str(document.uuid) for document in documents],
+            "initiated_at": _utc_timestamp(),
+            "user_id": user_id,
+            "user_email": user_email,
+            "phases": []
+        }
+        
+        try:
+            logger.info(f"📋 PHASE 1: Preparing bulk deletion (capturing rollback data)...")
+            await self._prepare_bulk_deletion(documents)
+            _record_phase(deletion_audit, "prepare")
+            
+            logger.info(f"🗑️  PHASE 2: Committing bulk deletion (removing from all systems)...")
+            await self._commit_bulk_deletion(documents)
+            _record_phase(deletion_audit, "commit")
+            
+            logger.info(f"✅ PHASE 3: Finalizing bulk deletion (audit logs and DB cleanup)...")
+            await self._finalize_bulk_deletion(documents, user_id, user_email, user_role)
+            # The last phase boundary is also the completion time
+            deletion_audit["status"] = "success"
+            deletion_audit["completed_at"] = _record_phase(deletion_audit, "finalize")
+            
+            logger.info(f"✅ Atomic deletion completed successfully for {len(documents)} documents")
+            
+            return {
+                "success": True,
+                "message": f"{len(documents)} documents deleted successfully from all systems",
+                "document_ids": deletion_audit["document_uuids"],
+                "audit": deletion_audit
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ Bulk atomic deletion FAILED: {e}")
+            deletion_audit["status"] = "failed"
+            deletion_audit["error"] = str(e)
+            deletion_audit["failed_at"] = _utc_timestamp()
+            
+            logger.warning(f"🔄 Initiating ROLLBACK for {len(documents)} documents...")
+            try:
+                await self._rollback_phases()
+                deletion_audit["rollback"] = "success"
+                logger.info(f"✅ Rollback completed successfully for bulk deletion")
+            except Exception as rollback_error:
+                logger.critical(f"🚨 ROLLBACK FAILED for bulk deletion: {rollback_error}")
+                deletion_audit["rollback"] = "failed"
+                deletion_audit["rollback_error"] = str(rollback_error)
+                
+                critical_audit = AuditLog(
+                    user_id=user_id,
+                    user_email=user_email,
+                    user_role=user_role,
+                    action="delete_rollback_failed",
+                    resource_type="documents",
+                    details={
+                        "document_uuids": deletion_audit["document_uuids"],
+                        "error": str(e),
+                        "rollback_error": str(rollback_error),
+                        "message": "CRITICAL: Documents may be in inconsistent state across systems",
+                        "requires_manual_intervention": True
+                    }
+                )
+                self.db.add(critical_audit)
+                await self.db.commit()
+            
+            raise Exception(f"Atomic deletion failed: {str(e)}") from e
+        
+        finally:
+            self._discard_spooled_objects()
+    
+    def _spool_object(self, object_key: str) -> Tuple[str, int, str]:
+        """
+        Copy a remote object into a temp file; returns (path, size, sha256)
+        
+        The storage backend's download() returns the whole object, so it is
+        held in memory until it has been written out. Only the spooled copy,
+        not the bytes, is kept for the rest of the deletion.
+        """
+        content = self.primary_storage.download(object_key)
+        with tempfile.NamedTemporaryFile(prefix="indoc-rollback-", delete=False) as tmp:
+            tmp.write(content)
+        return tmp.name, len(content), hashlib.sha256(content).hexdigest()
+    
+    def _restore_spooled_object(self, rollback_data: Dict[str, Any]):
+        """Re-upload a spooled copy after verifying its checksum"""
+        content = Path(rollback_data["spool_path"]).read_bytes()
+        if hashlib.sha256(content).hexdigest() != rollback_data["sha256"]:
+            raise ValueError("spooled copy failed checksum verification")
+        self.primary_storage.upload(rollback_data["object_key"], content)
+    
+    def _discard_spooled_objects(self):
+        """Remove rollback copies spooled during PREPARE"""
+        for phase in self.phases:
+            spool_path = (phase.rollback_data or {}).get("spool_path")
+            if spool_path:
+                try:
+                    os.unlink(spool_path)
+                except FileNotFoundError:
+                    pass
     
     async def _fetch_and_validate_document(
         self,
@@ -193,10 +330,101 @@ class AtomicDeletionService:
         PHASE 1: PREPARE
         Capture current state for potential rollback.
         Does NOT modify any data yet.
+        
+        The four checks are independent reads, so they run concurrently and
+        PREPARE takes as long as the slowest one. Each check records its own
+        failure on its phase rather than raising.
         """
-        phases_status = []
+        phases = await asyncio.gather(
+            self._check_elasticsearch(document),
+            self._check_qdrant(document),
+            self._check_local_storage(document),
+            self._check_remote_storage(document),
+        )
+        self.phases.extend(phases)
+        
+        logger.info(f"  ✅ PREPARE phase completed: {len(self.phases)} systems checked")
+    
+    async def _prepare_bulk_deletion(self, documents: List[Document]):
+        """
+        PHASE 1: PREPARE for a batch of documents.
+        
+        Elasticsearch and Qdrant are each read with a single multi-document
+        request; storage checks are per file and run concurrently, with at
+        most REMOTE_CHECK_CONCURRENCY remote objects downloaded at a time.
+        """
+        remote_slots = asyncio.Semaphore(REMOTE_CHECK_CONCURRENCY)
+        
+        async def check_remote_storage(document: Document) -> DeletionPhase:
+            async with remote_slots:
+                return await self._check_remote_storage(document)
+        
+        phases = await asyncio.gather(
+            self._check_elasticsearch_bulk(documents),
+            self._check_qdrant_bulk(documents),
+            *(self._check_local_storage(document) for document in documents),
+            *(check_remote_storage(document) for document in documents),
+        )
+        self.phases.extend(phases)
         
-        # 1. Check Elasticsearch presence
+        logger.info(f"  ✅ PREPARE phase completed: {len(self.phases)} checks for {len(documents)} documents")
+    
+    async def _check_elasticsearch_bulk(self, documents: List[Document]) -> DeletionPhase:
+        """Check Elasticsearch presence for a batch with one mget"""
+        phase = DeletionPhase("elasticsearch_bulk_check", "Check Elasticsearch index")
+        try:
+            es_ids = [document.elasticsearch_id for document in documents if document.elasticsearch_id]
+            sources = {}
+            if es_ids:
+                response = await self.es_service.client.mget(
+                    index=self.es_service.index_name,
+                    ids=es_ids
+                )
+                sources = {
+                    doc["_id"]: doc["_source"]
+                    for doc in response["docs"]
+                    if doc.get("found")
+                }
+            phase.rollback_data = {"exists": bool(sources), "sources": sources}
+            logger.debug(f"  ✓ Elasticsearch: {len(sources)}/{len(es_ids)} documents found")
+            
+            phase.completed = True
+        except Exception as e:
+            phase.error = str(e)
+            logger.warning(f"  ⚠ Elasticsearch check failed: {e}")
+        
+        return phase
+    
+    async def _check_qdrant_bulk(self, documents: List[Document]) -> DeletionPhase:
+        """Check Qdrant presence for a batch with one retrieve"""
+        phase = DeletionPhase("qdrant_bulk_check", "Check Qdrant vector store")
+        try:
+            qdrant_ids = [document.qdrant_id for document in documents if document.qdrant_id]
+            points = []
+            if qdrant_ids:
+                records = await asyncio.to_thread(
+                    self.qdrant_service.client.retrieve,
+                    collection_name=self.qdrant_service.collection_name,
+                    ids=qdrant_ids,
+                    with_payload=True,
+                    with_vectors=True
+                )
+                points = [
+                    {"id": record.id, "payload": record.payload, "vector": record.vector}
+                    for record in records
+                ]
+            phase.rollback_data = {"exists": bool(points), "points": points}
+            logger.debug(f"  ✓ Qdrant: {len(points)}/{len(qdrant_ids)} documents found")
+            
+            phase.completed = True
+        except Exception as e:
+            phase.error = str(e)
+            logger.warning(f"  ⚠ Qdrant check failed: {e}")
+        
+        return phase
+    
+    async def _check_elasticsearch(self, document: Document) -> DeletionPhase:
+        """Check Elasticsearch presence"""
         phase = DeletionPhase("elasticsearch_check", "Check Elasticsearch index")
         try:
             if document.elasticsearch_id:
@@ -225,16 +453,17 @@ class AtomicDeletionService:
             phase.error = str(e)
             logger.warning(f"  ⚠ Elasticsearch check failed: {e}")
         
-        self.phases.append(phase)
-        phases_status.append({"phase": phase.name, "status": "prepared"})
-        
-        # 2. Check Qdrant presence
+        return phase
+    
+    async def _check_qdrant(self, document: Document) -> DeletionPhase:
+        """Check Qdrant presence"""
         phase = DeletionPhase("qdrant_check", "Check Qdrant vector store")
         try:
             if document.qdrant_id:
                 # Verify document exists in Qdrant
                 try:
-                    qdrant_doc = self.qdrant_service.client.retrieve(
+                    qdrant_doc = await asyncio.to_thread(
+                        self.qdrant_service.client.retrieve,
                         collection_name=self.qdrant_service.collection_name,
                         ids=[document.qdrant_id],
                         with_payload=True,
@@ -263,19 +492,20 @@ class AtomicDeletionService:
             phase.error = str(e)
             logger.warning(f"  ⚠ Qdrant check failed: {e}")
         
-        self.phases.append(phase)
-        phases_status.append({"phase": phase.name, "status": "prepared"})
-        
-        # 3. Check local storage
+        return phase
+    
+    async def _check_local_storage(self, document: Document) -> DeletionPhase:
+        """Check local storage"""
         phase = DeletionPhase("local_storage_check", "Check local file storage")
         try:
             storage_path = Path(document.storage_path)
-            if storage_path.exists():
+            file_stat = await asyncio.to_thread(self._stat_if_exists, storage_path)
+            if file_stat is not None:
                 phase.rollback_data = {
                     "exists": True,
                     "path": str(storage_path),
-                    "size": storage_path.stat().st_size,
-                    "modified": storage_path.stat().st_mtime
+                    "size": file_stat.st_size,
+                    "modified": file_stat.st_mtime
                 }
                 logger.debug(f"  ✓ Local storage: File exists ({storage_path})")
             else:
@@ -287,14 +517,37 @@ class AtomicDeletionService:
             phase.error = str(e)
             logger.warning(f"  ⚠ Local storage check failed: {e}")
         
-        self.phases.append(phase)
-        phases_status.append({"phase": phase.name, "status": "prepared"})
-        
-        # 4. Check remote storage (S3/MinIO)
+        return phase
+    
+    @staticmethod
+    def _stat_if_exists(path: Path) -> Optional[os.stat_result]:
+        # One stat call; a missing file is the exception, not a second syscall
+        try:
+            return path.stat()
+        except FileNotFoundError:
+            return None
+    
+    @staticmethod
+    def _unlink_if_exists(path: Path) -> bool:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+    
+    @classmethod
+    def _unlink_all(cls, paths: List[Path]) -> int:
+        return sum(cls._unlink_if_exists(path) for path in paths)
+    
+    def _delete_remote_objects(self, object_keys: List[str]):
+        for object_key in object_keys:
+            self.primary_storage.delete(object_key)
+    
+    async def _check_remote_storage(self, document: Document) -> DeletionPhase:
+        """Check remote storage (S3/MinIO)"""
         phase = DeletionPhase("remote_storage_check", "Check remote object storage")
         try:
             # Build object key for remote storage
-            from app.services.storage.base import build_object_key
             object_key = build_object_key(
                 tenant_id=str(document.tenant_id),
                 document_uuid=str(document.uuid),
@@ -302,14 +555,16 @@ class AtomicDeletionService:
             )
             
             # Check if object exists
-            if self.primary_storage.exists(object_key):
-                # Download file content for potential restore
-                file_content = self.primary_storage.download(object_key)
+            if await asyncio.to_thread(self.primary_storage.exists, object_key):
+                # Spool a copy to disk for potential restore; only the path
+                # and checksum are kept for the rest of the deletion
+                spool_path, size, sha256 = await asyncio.to_thread(self._spool_object, object_key)
                 phase.rollback_data = {
                     "exists": True,
                     "object_key": object_key,
-                    "size": len(file_content),
-                    "content": file_content  # Store for rollback
+                    "size": size,
+                    "spool_path": spool_path,
+                    "sha256": sha256
                 }
                 logger.debug(f"  ✓ Remote storage: Object exists ({object_key})")
             else:
@@ -323,10 +578,7 @@ class AtomicDeletionService:
             phase.rollback_data = {"exists": False}
             logger.debug(f"  ⚠ Remote storage check skipped: {e}")
         
-        self.phases.append(phase)
-        phases_status.append({"phase": phase.name, "status": "prepared"})
-        
-        logger.info(f"  ✅ PREPARE phase completed: {len(self.phases)} systems checked")
+        return phase
     
     async def _commit_deletion(self, document: Document):
         """
@@ -350,7 +602,8 @@ class AtomicDeletionService:
         # 2. Delete from Qdrant
         try:
             if document.qdrant_id:
-                self.qdrant_service.client.delete(
+                await asyncio.to_thread(
+                    self.qdrant_service.client.delete,
                     collection_name=self.qdrant_service.collection_name,
                     points_selector=[document.qdrant_id]
                 )
@@ -364,15 +617,13 @@ class AtomicDeletionService:
         # 3. Delete from local storage
         try:
             storage_path = Path(document.storage_path)
-            if storage_path.exists():
-                storage_path.unlink()
+            if await asyncio.to_thread(self._unlink_if_exists, storage_path):
                 logger.debug(f"  ✓ Local storage: Deleted file {storage_path}")
             
             # Also delete temp file if exists
             if document.temp_path:
                 temp_path = Path(document.temp_path)
-                if temp_path.exists():
-                    temp_path.unlink()
+                if await asyncio.to_thread(self._unlink_if_exists, temp_path):
                     logger.debug(f"  ✓ Local storage: Deleted temp file {temp_path}")
         except Exception as e:
             error_msg = f"Local storage deletion failed: {e}"
@@ -382,15 +633,14 @@ class AtomicDeletionService:
         
         # 4. Delete from remote storage (S3/MinIO)
         try:
-            from app.services.storage.base import build_object_key
             object_key = build_object_key(
                 tenant_id=str(document.tenant_id),
                 document_uuid=str(document.uuid),
                 filename=document.filename
             )
             
-            if self.primary_storage.exists(object_key):
-                self.primary_storage.delete(object_key)
+            if await asyncio.to_thread(self.primary_storage.exists, object_key):
+                await asyncio.to_thread(self.primary_storage.delete, object_key)
                 logger.debug(f"  ✓ Remote storage: Deleted object {object_key}")
         except Exception as e:
             # Remote storage failure is logged but not critical
@@ -398,12 +648,89 @@ class AtomicDeletionService:
         
         logger.info(f"  ✅ COMMIT phase completed: Document removed from all systems")
     
+    async def _commit_bulk_deletion(self, documents: List[Document]):
+        """
+        PHASE 2: COMMIT for a batch of documents.
+        One request per backend regardless of batch size.
+        """
+        # 1. Delete from Elasticsearch with a single _bulk request
+        try:
+            es_ids = [document.elasticsearch_id for document in documents if document.elasticsearch_id]
+            if es_ids:
+                response = await self.es_service.client.bulk(
+                    operations=[
+                        {"delete": {"_index": self.es_service.index_name, "_id": es_id}}
+                        for es_id in es_ids
+                    ]
+                )
+                if response.get("errors"):
+                    # Missing documents are already gone, anything else is a failure
+                    failed = [
+                        item["delete"]["_id"]
+                        for item in response["items"]
+                        if item["delete"].get("status") not in (200, 404)
+                    ]
+                    if failed:
+                        raise Exception(f"failed to delete {', '.join(failed)}")
+                logger.debug(f"  ✓ Elasticsearch: Deleted {len(es_ids)} documents")
+        except Exception as e:
+            error_msg = f"Elasticsearch deletion failed: {e}"
+            logger.error(f"  ❌ {error_msg}")
+            raise Exception(error_msg) from e
+        
+        # 2. Delete from Qdrant with a single call
+        try:
+            qdrant_ids = [document.qdrant_id for document in documents if document.qdrant_id]
+            if qdrant_ids:
+                await asyncio.to_thread(
+                    self.qdrant_service.client.delete,
+                    collection_name=self.qdrant_service.collection_name,
+                    points_selector=qdrant_ids
+                )
+                logger.debug(f"  ✓ Qdrant: Deleted {len(qdrant_ids)} documents")
+        except Exception as e:
+            error_msg = f"Qdrant deletion failed: {e}"
+            logger.error(f"  ❌ {error_msg}")
+            raise Exception(error_msg) from e
+        
+        # 3. Delete from local storage, including temp files
+        try:
+            paths = [Path(document.storage_path) for document in documents]
+            paths.extend(Path(document.temp_path) for document in documents if document.temp_path)
+            deleted = await asyncio.to_thread(self._unlink_all, paths)
+            logger.debug(f"  ✓ Local storage: Deleted {deleted} files")
+        except Exception as e:
+            error_msg = f"Local storage deletion failed: {e}"
+            logger.error(f"  ❌ {error_msg}")
+            raise Exception(error_msg) from e
+        
+        # 4. Delete from remote storage the objects PREPARE found
+        try:
+            object_keys = [
+                phase.rollback_data["object_key"]
+                for phase in self.phases
+                if phase.name == "remote_storage_check"
+                and phase.rollback_data and phase.rollback_data.get("exists")
+            ]
+            if object_keys:
+                await asyncio.to_thread(self._delete_remote_objects, object_keys)
+                logger.debug(f"  ✓ Remote storage: Deleted {len(object_keys)} objects")
+        except Exception as e:
+            # Remote storage failure is logged but not critical
+            logger.warning(f"  ⚠ Remote storage deletion skipped: {e}")
+        
+        logger.info(f"  ✅ COMMIT phase completed: {len(documents)} documents removed from all systems")
+    
     async def _rollback_deletion(self, document: Document):
         """
         ROLLBACK: Restore document to all systems from captured rollback data.
         This is called if any deletion step fails.
         """
         logger.warning(f"🔄 Starting ROLLBACK for document {document.filename}")
+        await self._rollback_phases()
+    
+    async def _rollback_phases(self):
+        """Restore every system captured in self.phases"""
         rollback_errors = []
         
         for phase in self.phases:
@@ -420,9 +747,28 @@ class AtomicDeletionService:
                     )
                     logger.info(f"  ✓ Restored to Elasticsearch")
                 
+                elif phase.name == "elasticsearch_bulk_check" and phase.rollback_data.get("exists"):
+                    operations = []
+                    for es_id, source in phase.rollback_data["sources"].items():
+                        operations.append({"index": {"_index": self.es_service.index_name, "_id": es_id}})
+                        operations.append(source)
+                    response = await self.es_service.client.bulk(operations=operations)
+                    if response.get("errors"):
+                        raise Exception("some documents could not be re-indexed")
+                    logger.info(f"  ✓ Restored {len(phase.rollback_data['sources'])} documents to Elasticsearch")
+                
+                elif phase.name == "qdrant_bulk_check" and phase.rollback_data.get("exists"):
+                    await asyncio.to_thread(
+                        self.qdrant_service.client.upsert,
+                        collection_name=self.qdrant_service.collection_name,
+                        points=phase.rollback_data["points"]
+                    )
+                    logger.info(f"  ✓ Restored {len(phase.rollback_data['points'])} documents to Qdrant")
+                
                 elif phase.name == "qdrant_check" and phase.rollback_data.get("exists"):
                     # Restore to Qdrant
-                    self.qdrant_service.client.upsert(
+                    await asyncio.to_thread(
+                        self.qdrant_service.client.upsert,
                         collection_name=self.qdrant_service.collection_name,
                         points=[{
                             "id": phase.rollback_data["id"],
@@ -433,11 +779,8 @@ class AtomicDeletionService:
                     logger.info(f"  ✓ Restored to Qdrant")
                 
                 elif phase.name == "remote_storage_check" and phase.rollback_data.get("exists"):
-                    # Restore to remote storage
-                    self.primary_storage.upload(
-                        phase.rollback_data["object_key"],
-                        phase.rollback_data["content"]
-                    )
+                    # Restore to remote storage from the spooled copy
+                    await asyncio.to_thread(self._restore_spooled_object, phase.rollback_data)
                     logger.info(f"  ✓ Restored to remote storage")
                 
                 # Note: Local file restoration would require the file content to be stored,
@@ -494,4 +837,45 @@ class AtomicDeletionService:
         
         logger.debug(f"  ✓ PostgreSQL: Deleted document record and created audit log")
         logger.info(f"  ✅ FINALIZE phase completed: Audit log created, DB record removed")
-
+    
+    async def _finalize_bulk_deletion(
+        self,
+        documents: List[Document],
+        user_id: int,
+        user_email: str,
+        user_role: str
+    ):
+        """
+        PHASE 3: FINALIZE for a batch of documents.
+        One audit log per document; all rows go out in a single commit.
+        """
+        self.db.add_all([
+            AuditLog(
+                user_id=user_id,
+                user_email=user_email,
+                user_role=user_role,
+                action="delete",
+                resource_type="document",
+                resource_id=str(document.uuid),
+                details={
+                    "filename": document.filename,
+                    "file_size": document.file_size,
+                    "file_hash": document.file_hash,
+                    "elasticsearch_id": document.elasticsearch_id,
+                    "qdrant_id": document.qdrant_id,
+                    "storage_path": document.storage_path,
+                    "deletion_method": "atomic_2pc_bulk",
+                    "batch_size": len(documents)
+                }
+            )
+            for document in documents
+        ])
+        
+        # ORM deletes so chunk/metadata/annotation cascades still apply;
+        # the flush batches them into the one commit
+        for document in documents:
+            await self.db.delete(document)
+        await self.db.commit()
+        
+        logger.debug(f"  ✓ PostgreSQL: Deleted {len(documents)} document records and created audit logs")
+        logger.info(f"  ✅ FINALIZE phase completed: Audit logs created, DB records removed")
@@ -6,7 +6,7 @@ import zipfile
 import tempfile
 import shutil
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Set
 from uuid import UUID, uuid4
 from datetime import datetime
 import asyncio
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import hashlib
 import mimetypes
+import mmap
 
 from app.models.document import Document
 from app.models.user import User
@@ -24,6 +25,39 @@ from app.core.config import settings
 from app.core.websocket_manager import WebSocketManager
 
 
+# Files hashed at once by the folder pre-pass; hashlib releases the GIL, so
+# each runs on its own core
+_HASH_CONCURRENCY = min(8, os.cpu_count() or 1)
+
+# Files up to this size are memory-mapped for hashing; larger ones are read
+# in 1 MiB chunks so a single upload can't map an arbitrarily large file
+_MMAP_HASH_LIMIT = 256 * 1024 * 1024
+
+# Hashes per duplicate-lookup query; keeps each IN list well under driver
+# bind-parameter limits
+_HASH_LOOKUP_BATCH = 1000
+
+
+def _sha256_file(file_path: Path, max_size: Optional[int] = None) -> Optional[str]:
+    """
+    SHA256 of a file, read with plain blocking I/O; run it in a worker thread.
+    Returns None if the file is larger than max_size.
+    """
+    size = file_path.stat().st_size
+    if max_size is not None and size > max_size:
+        return None
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb", buffering=0) as f:
+        if 0 < size <= _MMAP_HASH_LIMIT:
+            # Hash straight from the page cache in a single update call
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256_hash.update(mapped)
+        else:
+            while chunk := f.read(1 << 20):
+                sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+
 class BulkUploadService:
     """Service for handling bulk file uploads and folder structures"""
     
@@ -121,6 +155,15 @@ class BulkUploadService:
         
         results["total_files"] = len(all_files)
         
+        # Hash every file up front, several at a time
+        file_hashes = await self._hash_files_batch(
+            [file_path for file_path, _ in all_files if not file_path.name.startswith('.')]
+        )
+        
+        # Duplicates are looked up for the whole folder at once, then tracked
+        # here as files are added so repeats inside the folder are caught too
+        known_hashes = await self._existing_file_hashes(tenant_id, file_hashes.values())
+        
         # Process each file
         for idx, (file_path, relative_path) in enumerate(all_files):
             # Calculate progress
@@ -151,15 +194,23 @@ class BulkUploadService:
                     int(progress)
                 )
                 
-                # Process individual file with metadata
-                document = await self._process_single_file(
-                    file_path=file_path,
-                    user=user,
-                    tenant_id=tenant_id,
-                    folder_structure=folder_structure,
-                    metadata=None,  # ZIP uploads don't have user metadata
-                    document_set_id=document_set_id
-                )
+                file_hash = file_hashes.get(file_path)
+                if file_hash in known_hashes:
+                    document = None  # Skip duplicate
+                else:
+                    # Process individual file with metadata
+                    document = await self._process_single_file(
+                        file_path=file_path,
+                        user=user,
+                        tenant_id=tenant_id,
+                        folder_structure=folder_structure,
+                        metadata=None,  # ZIP uploads don't have user metadata
+                        document_set_id=document_set_id,
+                        precomputed_hash=file_hash,
+                        check_duplicate=file_hash is None
+                    )
+                    if document:
+                        known_hashes.add(document.file_hash)
                 
                 if document:
                     results["successful_uploads"] += 1
@@ -200,29 +251,37 @@ class BulkUploadService:
         tenant_id: UUID,
         folder_structure: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
-        document_set_id: Optional[str] = None
+        document_set_id: Optional[str] = None,
+        precomputed_hash: Optional[str] = None,
+        check_duplicate: bool = True
     ) -> Optional[Document]:
-        """Process a single file and add to database with full audit metadata"""
+        """
+        Process a single file and add to database with full audit metadata
+        
+        Pass check_duplicate=False when the caller has already checked the
+        hash against existing documents.
+        """
         
         # Check file size
         file_size = file_path.stat().st_size
         if file_size > settings.MAX_FILE_SIZE:
             raise ValueError(f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE} bytes")
         
-        # Calculate file hash
-        file_hash = await self._calculate_file_hash(file_path)
+        # Calculate file hash, unless the caller already has it
+        file_hash = precomputed_hash or await self._calculate_file_hash(file_path)
         
         # Check for duplicates
-        result = await self.db.execute(
-            select(Document).where(
-                Document.file_hash == file_hash,
-                Document.tenant_id == tenant_id
+        if check_duplicate:
+            result = await self.db.execute(
+                select(Document).where(
+                    Document.file_hash == file_hash,
+                    Document.tenant_id == tenant_id
+                )
             )
-        )
-        existing_doc = result.scalar_one_or_none()
-        
-        if existing_doc:
-            return None  # Skip duplicate
+            existing_doc = result.scalar_one_or_none()
+            
+            if existing_doc:
+                return None  # Skip duplicate
         
         # Extract original filename from metadata FIRST (needed for storage path)
         original_filename = metadata.get('original_filename') if metadata else None
@@ -242,10 +301,9 @@ class BulkUploadService:
         
         file_extension = file_path.suffix.lower().strip('.')
         
-        # Copy file to storage location with original filename
+        # Copy file to storage location with original filename, off the event loop
         storage_path = self.upload_dir / f"{tenant_id}" / final_storage_name
-        storage_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(file_path, storage_path)
+        await asyncio.to_thread(self._copy_to_storage, file_path, storage_path)
         
         # Build comprehensive audit metadata
         audit_metadata = {
@@ -308,15 +366,51 @@ class BulkUploadService:
         
         return document
     
+    async def _existing_file_hashes(self, tenant_id: UUID, file_hashes: Iterable[str]) -> Set[str]:
+        """Which of these hashes the tenant already has, in batches of _HASH_LOOKUP_BATCH"""
+        pending = list(set(file_hashes))
+        existing = set()
+        for start in range(0, len(pending), _HASH_LOOKUP_BATCH):
+            result = await self.db.execute(
+                select(Document.file_hash).where(
+                    Document.tenant_id == tenant_id,
+                    Document.file_hash.in_(pending[start:start + _HASH_LOOKUP_BATCH])
+                )
+            )
+            existing.update(result.scalars())
+        return existing
+    
+    @staticmethod
+    def _copy_to_storage(file_path: Path, storage_path: Path):
+        storage_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(file_path, storage_path)
+    
     async def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of a file"""
-        sha256_hash = hashlib.sha256()
+        """Calculate SHA256 hash of a file in one worker thread"""
+        return await asyncio.to_thread(_sha256_file, file_path)
+    
+    async def _hash_files_batch(self, file_paths: List[Path]) -> Dict[Path, str]:
+        """
+        Hash several files in parallel worker threads.
         
-        async with aiofiles.open(file_path, "rb") as f:
-            while chunk := await f.read(8192):
-                sha256_hash.update(chunk)
+        Files that are over the size limit or can't be read are left out;
+        _process_single_file reports those when it reaches them.
+        """
+        semaphore = asyncio.Semaphore(_HASH_CONCURRENCY)
+        
+        async def hash_one(file_path: Path) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(_sha256_file, file_path, settings.MAX_FILE_SIZE)
         
-        return sha256_hash.hexdigest()
+        digests = await asyncio.gather(
+            *(hash_one(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        return {
+            file_path: digest
+            for file_path, digest in zip(file_paths, digests)
+            if isinstance(digest, str)
+        }
     
     async def _queue_for_processing(self, document: Document):
         """Queue document for text extraction and indexing"""
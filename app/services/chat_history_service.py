@@ -2,7 +2,7 @@
 Chat history management service with storage quotas and retention
 """
 from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, desc
 from sqlalchemy.orm import selectinload
@@ -263,7 +263,7 @@ class ChatHistoryService:
         # Restore
         retention.is_archived = False
         retention.archived_at = None
-        retention.last_accessed_at = datetime.utcnow()
+        retention.last_accessed_at = datetime.now(timezone.utc)
         
         # Update quota
         quota.current_conversation_storage += size_difference
@@ -402,10 +402,10 @@ class ChatHistoryService:
         # Update quota limits
         quota.premium_tier = tier
         quota.is_premium = tier != "free"
-        quota.conversation_storage_limit = tier_config["conversation_storage"]
-        quota.document_storage_limit = tier_config["document_storage"]
-        quota.conversation_retention_days = tier_config["conversation_retention"]
-        quota.monthly_fee = tier_config["monthly_fee"]
+        quota.conversation_storage_limit = tier_config.conversation_storage
+        quota.document_storage_limit = tier_config.document_storage
+        quota.conversation_retention_days = tier_config.conversation_retention
+        quota.monthly_fee = tier_config.monthly_fee
         
         if tier != "free":
             quota.premium_expires_at = datetime.utcnow() + timedelta(days=30)
@@ -438,9 +438,9 @@ class ChatHistoryService:
             tier_config = STORAGE_TIERS["free"]
             quota = UserStorageQuota(
                 user_id=user.id,
-                conversation_storage_limit=tier_config["conversation_storage"],
-                document_storage_limit=tier_config["document_storage"],
-                conversation_retention_days=tier_config["conversation_retention"]
+                conversation_storage_limit=tier_config.conversation_storage,
+                document_storage_limit=tier_config.document_storage,
+                conversation_retention_days=tier_config.conversation_retention
             )
             db.add(quota)
             await db.commit()
@@ -511,7 +511,7 @@ class ChatHistoryService:
         retention = retention.scalar_one_or_none()
         
         if retention:
-            retention.last_accessed_at = datetime.utcnow()
+            retention.last_accessed_at = datetime.now(timezone.utc)
             await db.commit()
     
     async def _apply_retention_policies(
@@ -197,9 +197,9 @@ class ConversationService:
                 tenant_id,
                 document_id=chat_request.document_ids[0] if chat_request.document_ids else None
             )
-            # Store all document IDs in the conversation's metadata
+            # Store all document IDs on the conversation
             if chat_request.document_ids:
-                conversation.conversation_metadata = {"document_ids": [str(doc_id) for doc_id in chat_request.document_ids]}
+                conversation.document_ids = list(chat_request.document_ids)
                 self.db.commit()
 
         # Add user message
@@ -353,8 +353,8 @@ class ConversationService:
         
         return ChatResponse(
             conversation_id=conversation.id,
-            message=MessageResponse.from_orm(user_message),
-            response=MessageResponse.from_orm(assistant_message)
+            message=MessageResponse.model_validate(user_message),
+            response=MessageResponse.model_validate(assistant_message)
         )
     
     async def _build_conversation_context(
@@ -367,9 +367,9 @@ class ConversationService:
         context_parts = []
         document_ids_to_search = []
 
-        # Get document IDs from metadata if available
-        if 'document_ids' in (conversation.conversation_metadata or {}):
-            document_ids_to_search = [UUID(doc_id) for doc_id in conversation.conversation_metadata.get('document_ids', [])]
+        # Get the conversation's document IDs if it has any
+        if conversation.document_ids:
+            document_ids_to_search = list(conversation.document_ids)
         elif conversation.document_id:
             document_ids_to_search.append(conversation.document_id)
 
@@ -7,13 +7,43 @@ from uuid import UUID as UUID_t
 from dataclasses import dataclass
 from app.core.cache import cache_service
 from app.core.document_scope import get_effective_document_ids
-from sqlalchemy import select
+from sqlalchemy import Boolean, literal, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import undefer
+from sqlalchemy.sql.expression import FunctionElement
 from app.models.document import Document
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
 
+class _full_text_match(FunctionElement):
+    """full_text_tsv @@ plainto_tsquery(query); substring match off PostgreSQL"""
+    type = Boolean()
+    inherit_cache = True
+
+
+@compiles(_full_text_match, 'postgresql')
+def _pg_full_text_match(element, compiler, **kw):
+    tsv, _text, query = element.clauses
+    return "%s @@ plainto_tsquery('english', %s)" % (
+        compiler.process(tsv, **kw), compiler.process(query, **kw)
+    )
+
+
+@compiles(_full_text_match)
+def _compile_full_text_match(element, compiler, **kw):
+    _tsv, text, query = element.clauses
+    return "(lower(%s) LIKE '%%' || lower(%s) || '%%')" % (
+        compiler.process(text, **kw), compiler.process(query, **kw)
+    )
+
+
+def _full_text_matches(query: str):
+    """Match document bodies via the GIN-indexed full_text_tsv column"""
+    return _full_text_match(Document.full_text_tsv, Document.full_text, literal(query))
+
+
 @dataclass
 class SearchResult:
     """Search result data class"""
@@ -100,9 +130,9 @@ class SearchService:
                         or_(
                             Document.title.ilike(f"%{query}%"),
                             Document.description.ilike(f"%{query}%"),
-                            Document.full_text.ilike(f"%{query}%")
+                            _full_text_matches(query)
                         )
-                    )
+                    ).options(undefer(Document.full_text))
                     
                     # Apply scope filtering
                     if effective_doc_ids is not None:
@@ -128,7 +158,7 @@ class SearchService:
                             or_(
                                 Document.title.ilike(f"%{query}%"),
                                 Document.description.ilike(f"%{query}%"),
-                                Document.full_text.ilike(f"%{query}%")
+                                _full_text_matches(query)
                             )
                         ).limit(limit).all()
                     
@@ -203,9 +233,9 @@ class SearchService:
                 or_(
                     Document.title.ilike(f"%{query}%"),
                     Document.description.ilike(f"%{query}%"),
-                    Document.full_text.ilike(f"%{query}%")
+                    _full_text_matches(query)
                 )
-            )
+            ).options(undefer(Document.full_text))
             if effective_doc_ids is not None:
                 kw_query = kw_query.where(Document.id.in_(effective_doc_ids))
 
@@ -292,7 +322,9 @@ class SearchService:
 
                 if hasattr(self.db, 'execute'):
                     # Async session - no tenant filtering for search service
-                    query = select(Document).where(Document.uuid.in_(normalized_ids))
+                    query = select(Document).where(
+                        Document.uuid.in_(normalized_ids)
+                    ).options(undefer(Document.full_text))
                     result = await self.db.execute(query)
                     db_documents = result.scalars().all()
                 else:
@@ -353,7 +385,9 @@ class SearchService:
             if self.db:
                 if hasattr(self.db, 'execute'):
                     # Async session
-                    query = select(Document).where(Document.uuid == document_id)
+                    query = select(Document).where(
+                        Document.uuid == document_id
+                    ).options(undefer(Document.full_text))
                     result = await self.db.execute(query)
                     doc = result.scalar_one_or_none()
                 else:
@@ -9,6 +9,11 @@ import logging
 import time
 
 from app.core.celery_app import celery_app
+from app.crud.document_chunk import (
+    build_chunk_rows,
+    bulk_insert_chunks_sync,
+    delete_chunks_for_document_sync,
+)
 from app.db.session import SessionLocal
 from app.models.document import Document
 from app.services.text_extraction_service import TextExtractionService
@@ -258,11 +263,17 @@ def process_document(self, document_id: str) -> Dict[str, Any]:
                 text_length = len(extracted.get("text", ""))
                 document.full_text = extracted.get("text", "")
                 document.status = "text_extracted"
+                # Replace any chunks from an earlier run; rows go in as one
+                # multi-row INSERT (or COPY for large documents)
+                delete_chunks_for_document_sync(self.db, document.id)
+                chunk_count = bulk_insert_chunks_sync(
+                    self.db, build_chunk_rows(document.id, document.full_text)
+                )
                 self.db.commit()
                 run_async(send_progress_update(
                     document_id, "text_extraction", "completed", 100,
                     f"✅ Extracted {text_length:,} characters ({extract_duration:.1f}s)",
-                    [f"Ready for indexing"]
+                    [f"Stored {chunk_count} chunks", "Ready for indexing"]
                 ))
             else:
                 error_msg = extracted.get("error") if extracted else "Unknown extraction error"
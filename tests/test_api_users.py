@@ -0,0 +1,183 @@
+"""
+Tests for the user management API request bodies
+"""
+import pytest
+from httpx import AsyncClient
+from starlette.requests import Request
+
+from app.api.deps import json_body_narrowed
+from app.middleware.rate_limiting import rate_limiter
+from app.models.user import User
+from app.schemas.user import (
+    UserUpdate,
+    UserProfileUpdate,
+    UserAdminUpdate,
+    UserPasswordUpdate,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """/users is limited per client; start each test with a fresh window"""
+    rate_limiter.clients.clear()
+    yield
+    rate_limiter.clients.clear()
+
+
+def _json_request(body: bytes) -> Request:
+    """Minimal request whose body is the given bytes"""
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+    return Request({"type": "http", "method": "PUT", "headers": []}, receive)
+
+
+_parse_user_update = json_body_narrowed(
+    UserUpdate, UserProfileUpdate, UserAdminUpdate, UserPasswordUpdate
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body, expected", [
+    (b'{"full_name": "Jane Doe", "department": "Legal"}', UserProfileUpdate),
+    (b'{"role": "Manager", "is_active": false}', UserAdminUpdate),
+    (b'{"password": "N3w!Passw0rd"}', UserPasswordUpdate),
+    (b'{"full_name": "Jane Doe", "role": "Manager"}', UserUpdate),
+])
+async def test_update_body_validated_with_narrowest_group(body, expected):
+    """Bodies within one field group use that group's model; mixed bodies use UserUpdate"""
+    user_data = await _parse_user_update(_json_request(body))
+
+    assert type(user_data) is expected
+
+
+@pytest.mark.asyncio
+async def test_update_user_profile_fields(
+    client: AsyncClient,
+    test_user: User,
+    admin_token: str
+):
+    """A profile-only body updates just those fields"""
+    response = await client.put(
+        f"/api/v1/users/{test_user.id}",
+        json={"full_name": "Renamed User", "department": "Legal"},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["full_name"] == "Renamed User"
+    assert data["department"] == "Legal"
+    assert data["role"] == "Viewer"
+
+
+@pytest.mark.asyncio
+async def test_update_user_mixed_fields(
+    client: AsyncClient,
+    test_user: User,
+    admin_token: str
+):
+    """A body spanning several field groups is still applied in full"""
+    response = await client.put(
+        f"/api/v1/users/{test_user.id}",
+        json={"full_name": "Promoted User", "role": "Manager", "is_verified": True},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["full_name"] == "Promoted User"
+    assert data["role"] == "Manager"
+    assert data["is_verified"] is True
+
+
+@pytest.mark.asyncio
+async def test_create_user(
+    client: AsyncClient,
+    admin_token: str
+):
+    """A valid body parsed by json_body creates the user"""
+    response = await client.post(
+        "/api/v1/users/",
+        json={
+            "email": "new.user@example.com",
+            "username": "newuser",
+            "full_name": "New User",
+            "password": "Str0ng!Passw0rd",
+            "role": "Analyst"
+        },
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code in (200, 201)
+    data = response.json()
+    assert data["email"] == "new.user@example.com"
+    assert data["role"] == "Analyst"
+    assert "password" not in data
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path", [
+    ("POST", "/api/v1/users/"),
+    ("PUT", "/api/v1/users/{user_id}"),
+])
+async def test_invalid_json_body_returns_422(
+    client: AsyncClient,
+    test_user: User,
+    admin_token: str,
+    method,
+    path
+):
+    """Malformed JSON is reported as a body validation error"""
+    response = await client.request(
+        method,
+        path.format(user_id=test_user.id),
+        content=b'{"email": ',
+        headers={
+            "Authorization": f"Bearer {admin_token}",
+            "Content-Type": "application/json"
+        }
+    )
+
+    assert response.status_code == 422
+    errors = response.json()["detail"]
+    assert errors and all(err["loc"][0] == "body" for err in errors)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method, path, body, field", [
+    ("POST", "/api/v1/users/", {
+        "email": "not-an-email",
+        "username": "newuser",
+        "full_name": "New User",
+        "password": "Str0ng!Passw0rd"
+    }, "email"),
+    ("POST", "/api/v1/users/", {
+        "email": "weak@example.com",
+        "username": "weakuser",
+        "full_name": "Weak User",
+        "password": "short"
+    }, "password"),
+    ("PUT", "/api/v1/users/{user_id}", {"role": "Superuser"}, "role"),
+    ("PUT", "/api/v1/users/{user_id}", {"full_name": "Mixed", "is_active": "maybe"}, "is_active"),
+    ("PUT", "/api/v1/users/{user_id}", {"full_name": "Typo", "departmnet": "Legal"}, "departmnet"),
+])
+async def test_invalid_fields_return_422_under_body(
+    client: AsyncClient,
+    test_user: User,
+    admin_token: str,
+    method,
+    path,
+    body,
+    field
+):
+    """Field errors keep FastAPI's ("body", <field>) location"""
+    response = await client.request(
+        method,
+        path.format(user_id=test_user.id),
+        json=body,
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+
+    assert response.status_code == 422
+    locs = [tuple(err["loc"]) for err in response.json()["detail"]]
+    assert ("body", field) in locs
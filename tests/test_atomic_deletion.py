@@ -7,7 +7,12 @@ Tests:
 3. Rollback on Qdrant failure
 4. Rollback on local storage failure
 5. Audit trail verification
+6. Bulk deletion: ES _bulk errors, rollback, spooled copies, bounded downloads,
+   /bulk-action counts
 """
+import os
+import threading
+import time
 import pytest
 import asyncio
 from uuid import uuid4, UUID
@@ -18,7 +23,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.models.document import Document
 from app.models.user import User
-from app.services.atomic_deletion_service import AtomicDeletionService
+from app.services.atomic_deletion_service import AtomicDeletionService, REMOTE_CHECK_CONCURRENCY
 
 
 @pytest.fixture
@@ -284,6 +289,274 @@ async def test_audit_trail_creation(mock_db_session, sample_document):
         print("✅ Test passed: Comprehensive audit trail created")
 
 
+
+@pytest.fixture
+def sample_documents():
+    """Create a batch of documents for bulk deletion tests"""
+    tenant_id = uuid4()
+    return [
+        Document(
+            id=index,
+            uuid=uuid4(),
+            tenant_id=tenant_id,
+            filename=f"batch_document_{index}.pdf",
+            storage_path=f"/data/storage/tenant_id/batch_document_{index}.pdf",
+            file_size=1024,
+            file_hash=f"hash{index}",
+            file_type="pdf",
+            uploaded_by=1,
+            elasticsearch_id=f"es_batch_{index}",
+            qdrant_id=f"qdrant_batch_{index}",
+            status="indexed"
+        )
+        for index in (1, 2)
+    ]
+
+
+def _mock_bulk_backends(MockES, MockQdrant, documents, delete_statuses):
+    """Wire ES/Qdrant mocks: mget finds every document, _bulk deletes report delete_statuses"""
+    mock_es = MockES.return_value
+    mock_es.index_name = "documents"
+    mock_es.client.mget = AsyncMock(return_value={"docs": [
+        {"_id": doc.elasticsearch_id, "found": True, "_source": {"filename": doc.filename}}
+        for doc in documents
+    ]})
+    delete_response = {
+        "errors": any(status != 200 for status in delete_statuses),
+        "items": [
+            {"delete": {"_id": doc.elasticsearch_id, "status": status}}
+            for doc, status in zip(documents, delete_statuses)
+        ]
+    }
+    # First call deletes; a second call (rollback) re-indexes
+    mock_es.client.bulk = AsyncMock(side_effect=[delete_response, {"errors": False}])
+    
+    mock_qdrant = MockQdrant.return_value
+    mock_qdrant.collection_name = "documents"
+    mock_qdrant.client.retrieve = Mock(return_value=[
+        Mock(id=doc.qdrant_id, payload={"filename": doc.filename}, vector=[0.1, 0.2])
+        for doc in documents
+    ])
+    mock_qdrant.client.delete = Mock()
+    mock_qdrant.client.upsert = Mock()
+    return mock_es, mock_qdrant
+
+
+def _mock_db(session):
+    session.add = Mock()
+    session.add_all = Mock()
+    session.delete = AsyncMock()
+    session.commit = AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_bulk_deletion_treats_missing_es_documents_as_deleted(mock_db_session, sample_documents):
+    """A 404 item in the ES _bulk response is not a failure; one request per backend"""
+    
+    with patch('app.services.atomic_deletion_service.ElasticsearchService') as MockES, \
+         patch('app.services.atomic_deletion_service.QdrantService') as MockQdrant, \
+         patch('app.services.atomic_deletion_service.get_primary_storage') as MockStorage, \
+         patch('pathlib.Path.stat', side_effect=FileNotFoundError), \
+         patch('pathlib.Path.unlink'):
+        
+        mock_es, mock_qdrant = _mock_bulk_backends(MockES, MockQdrant, sample_documents, [200, 404])
+        MockStorage.return_value.exists = Mock(return_value=False)
+        _mock_db(mock_db_session)
+        
+        service = AtomicDeletionService(mock_db_session)
+        result = await service.delete_documents_atomic(
+            sample_documents,
+            user_id=1,
+            user_email="admin@test.com",
+            user_role="Admin"
+        )
+        
+        assert result["success"] is True
+        assert result["document_ids"] == [str(doc.uuid) for doc in sample_documents]
+        assert [p["phase"] for p in result["audit"]["phases"]] == ["prepare", "commit", "finalize"]
+        
+        mock_es.client.mget.assert_called_once()
+        mock_es.client.bulk.assert_called_once()
+        mock_qdrant.client.delete.assert_called_once()
+        assert mock_qdrant.client.delete.call_args.kwargs["points_selector"] == [
+            doc.qdrant_id for doc in sample_documents
+        ]
+        assert mock_db_session.delete.await_count == len(sample_documents)
+        mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_deletion_rolls_back_on_es_item_failure(mock_db_session, sample_documents):
+    """A non-200/404 item fails the batch and both bulk checks are restored"""
+    
+    with patch('app.services.atomic_deletion_service.ElasticsearchService') as MockES, \
+         patch('app.services.atomic_deletion_service.QdrantService') as MockQdrant, \
+         patch('app.services.atomic_deletion_service.get_primary_storage') as MockStorage, \
+         patch('pathlib.Path.stat', side_effect=FileNotFoundError):
+        
+        mock_es, mock_qdrant = _mock_bulk_backends(MockES, MockQdrant, sample_documents, [200, 500])
+        MockStorage.return_value.exists = Mock(return_value=False)
+        _mock_db(mock_db_session)
+        
+        service = AtomicDeletionService(mock_db_session)
+        with pytest.raises(Exception) as exc_info:
+            await service.delete_documents_atomic(
+                sample_documents,
+                user_id=1,
+                user_email="admin@test.com",
+                user_role="Admin"
+            )
+        
+        assert "Atomic deletion failed" in str(exc_info.value)
+        assert sample_documents[1].elasticsearch_id in str(exc_info.value)
+        
+        # Second _bulk call re-indexes every captured source
+        assert mock_es.client.bulk.await_count == 2
+        operations = mock_es.client.bulk.await_args_list[1].kwargs["operations"]
+        restored_ids = [op["index"]["_id"] for op in operations if "index" in op]
+        assert restored_ids == [doc.elasticsearch_id for doc in sample_documents]
+        
+        mock_qdrant.client.upsert.assert_called_once()
+        restored_points = mock_qdrant.client.upsert.call_args.kwargs["points"]
+        assert [point["id"] for point in restored_points] == [doc.qdrant_id for doc in sample_documents]
+        
+        # Nothing reached the database
+        mock_qdrant.client.delete.assert_not_called()
+        mock_db_session.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_deletion_removes_spooled_copies(mock_db_session, sample_documents):
+    """Remote objects spooled during PREPARE are restored on failure and removed afterwards"""
+    
+    with patch('app.services.atomic_deletion_service.ElasticsearchService') as MockES, \
+         patch('app.services.atomic_deletion_service.QdrantService') as MockQdrant, \
+         patch('app.services.atomic_deletion_service.get_primary_storage') as MockStorage, \
+         patch('app.services.atomic_deletion_service.build_object_key', side_effect=lambda **kw: kw["document_uuid"]), \
+         patch('pathlib.Path.stat', side_effect=FileNotFoundError):
+        
+        mock_es, mock_qdrant = _mock_bulk_backends(MockES, MockQdrant, sample_documents, [200, 200])
+        mock_qdrant.client.delete = Mock(side_effect=Exception("Qdrant connection failed"))
+        mock_storage = MockStorage.return_value
+        mock_storage.exists = Mock(return_value=True)
+        mock_storage.download = Mock(return_value=b"original bytes")
+        mock_storage.upload = Mock()
+        _mock_db(mock_db_session)
+        
+        service = AtomicDeletionService(mock_db_session)
+        with pytest.raises(Exception):
+            await service.delete_documents_atomic(
+                sample_documents,
+                user_id=1,
+                user_email="admin@test.com",
+                user_role="Admin"
+            )
+        
+        spool_paths = [
+            phase.rollback_data["spool_path"]
+            for phase in service.phases
+            if phase.name == "remote_storage_check"
+        ]
+        assert len(spool_paths) == len(sample_documents)
+        assert not any(os.path.exists(path) for path in spool_paths)
+        
+        # Each object was re-uploaded from its verified spooled copy
+        assert mock_storage.upload.call_count == len(sample_documents)
+        mock_storage.upload.assert_any_call(str(sample_documents[0].uuid), b"original bytes")
+
+
+@pytest.mark.asyncio
+async def test_bulk_prepare_limits_concurrent_downloads(mock_db_session):
+    """Bulk PREPARE never downloads more than REMOTE_CHECK_CONCURRENCY objects at once"""
+    documents = [
+        Document(
+            id=index,
+            uuid=uuid4(),
+            tenant_id=uuid4(),
+            filename=f"large_batch_{index}.pdf",
+            storage_path=f"/data/storage/tenant_id/large_batch_{index}.pdf",
+            elasticsearch_id=f"es_large_{index}",
+            qdrant_id=f"qdrant_large_{index}"
+        )
+        for index in range(REMOTE_CHECK_CONCURRENCY * 3)
+    ]
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    
+    def download(object_key):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return b"object bytes"
+    
+    with patch('app.services.atomic_deletion_service.ElasticsearchService') as MockES, \
+         patch('app.services.atomic_deletion_service.QdrantService') as MockQdrant, \
+         patch('app.services.atomic_deletion_service.get_primary_storage') as MockStorage, \
+         patch('pathlib.Path.stat', side_effect=FileNotFoundError):
+        
+        _mock_bulk_backends(MockES, MockQdrant, documents, [200] * len(documents))
+        MockStorage.return_value.exists = Mock(return_value=True)
+        MockStorage.return_value.download = Mock(side_effect=download)
+        
+        service = AtomicDeletionService(mock_db_session)
+        try:
+            await service._prepare_bulk_deletion(documents)
+        finally:
+            service._discard_spooled_objects()
+    
+    assert MockStorage.return_value.download.call_count == len(documents)
+    assert 1 < peak <= REMOTE_CHECK_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_bulk_action_delete_reports_whole_batch_on_failure(
+    client,
+    test_db,
+    test_admin_user,
+    admin_token
+):
+    """/bulk-action delete counts every accessible document as failed when the batch rolls back"""
+    documents = [
+        Document(
+            filename=f"bulk_{index}.pdf",
+            file_type="pdf",
+            file_size=1024,
+            storage_path=f"/tmp/bulk_{index}.pdf",
+            status="indexed",
+            uploaded_by=test_admin_user.id
+        )
+        for index in range(3)
+    ]
+    test_db.add_all(documents)
+    await test_db.commit()
+    
+    with patch(
+        'app.services.atomic_deletion_service.AtomicDeletionService.__init__', return_value=None
+    ), patch(
+        'app.services.atomic_deletion_service.AtomicDeletionService.delete_documents_atomic',
+        new=AsyncMock(side_effect=Exception("Atomic deletion failed: ES down"))
+    ) as mock_delete:
+        response = await client.post(
+            "/api/v1/files/bulk-action",
+            params={"action": "delete"},
+            json=[str(doc.uuid) for doc in documents],
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["accessible"] == len(documents)
+    assert data["success"] == 0
+    assert data["errors"] == len(documents)
+    
+    mock_delete.assert_awaited_once()
+    assert {doc.uuid for doc in mock_delete.await_args.args[0]} == {doc.uuid for doc in documents}
+
 if __name__ == "__main__":
     """Run tests directly"""
     asyncio.run(test_successful_atomic_deletion(None, None))
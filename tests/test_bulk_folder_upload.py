@@ -299,3 +299,115 @@ async def test_bulk_upload_preserves_audit_metadata(client: AsyncClient, test_to
         # Note: To fully verify audit metadata, we'd need to query the database
         # which would require additional fixtures. This test verifies the API response.
 
+
+
+@pytest.fixture
+def bulk_service(test_db, tmp_path, monkeypatch):
+    """BulkUploadService writing to a temporary storage directory, with queuing stubbed out"""
+    from app.core.config import settings
+    from app.services.bulk_upload_service import BulkUploadService
+    
+    monkeypatch.setattr(settings, "STORAGE_PATH", tmp_path / "storage")
+    service = BulkUploadService(test_db)
+    service._queue_for_processing = AsyncMock()
+    return service
+
+
+def _write(path: Path, content: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_process_folder_skips_repeat_within_folder(bulk_service, test_user, tmp_path):
+    """The same content twice in one folder is stored once and reported as a duplicate"""
+    from uuid import uuid4
+    
+    folder = tmp_path / "upload"
+    _write(folder / "a" / "report.txt", b"identical content")
+    _write(folder / "b" / "report-copy.txt", b"identical content")
+    _write(folder / "notes.txt", b"different content")
+    
+    results = await bulk_service.process_folder(folder, test_user, uuid4())
+    
+    assert results["total_files"] == 3
+    assert results["successful_uploads"] == 2
+    assert results["skipped_duplicates"] == 1
+    assert results["failed_uploads"] == 0
+    assert [f["status"] for f in results["files"]].count("duplicate") == 1
+
+
+@pytest.mark.asyncio
+async def test_process_folder_skips_hash_known_for_tenant(bulk_service, test_db, test_user, tmp_path):
+    """A file whose hash the tenant already has is skipped; other tenants' hashes don't count"""
+    import hashlib
+    from uuid import uuid4
+    from app.models.document import Document
+    
+    tenant_id = uuid4()
+    content = b"already uploaded"
+    for owner in (tenant_id, uuid4()):
+        test_db.add(Document(
+            tenant_id=owner,
+            filename="existing.txt",
+            file_type="txt",
+            file_size=len(content),
+            file_hash=hashlib.sha256(content).hexdigest(),
+            storage_path="/tmp/existing.txt",
+            status="indexed",
+            uploaded_by=test_user.id
+        ))
+    await test_db.commit()
+    
+    folder = tmp_path / "upload"
+    _write(folder / "existing-again.txt", content)
+    _write(folder / "new.txt", b"brand new")
+    
+    results = await bulk_service.process_folder(folder, test_user, tenant_id)
+    
+    assert results["successful_uploads"] == 1
+    assert results["skipped_duplicates"] == 1
+    duplicate = next(f for f in results["files"] if f["status"] == "duplicate")
+    assert duplicate["filename"] == "existing-again.txt"
+
+
+@pytest.mark.asyncio
+async def test_process_folder_reports_unhashable_files_as_failed(bulk_service, test_user, tmp_path, monkeypatch):
+    """Files the pre-pass can't hash go through _process_single_file, which reports the failure"""
+    from uuid import uuid4
+    from app.core.config import settings
+    from app.services import bulk_upload_service
+    
+    folder = tmp_path / "upload"
+    _write(folder / "ok.txt", b"small")
+    _write(folder / "too-big.txt", b"x" * 64)
+    unreadable = _write(folder / "unreadable.txt", b"secret")
+    
+    monkeypatch.setattr(settings, "MAX_FILE_SIZE", 32)
+    real_sha256_file = bulk_upload_service._sha256_file
+    
+    def sha256_file(file_path, max_size=None):
+        if file_path == unreadable:
+            raise PermissionError(f"Permission denied: '{file_path}'")
+        return real_sha256_file(file_path, max_size)
+    
+    monkeypatch.setattr(bulk_upload_service, "_sha256_file", sha256_file)
+    process_single_file = AsyncMock(wraps=bulk_service._process_single_file)
+    bulk_service._process_single_file = process_single_file
+    
+    results = await bulk_service.process_folder(folder, test_user, uuid4())
+    
+    assert results["successful_uploads"] == 1
+    assert results["failed_uploads"] == 2
+    failed = {f["filename"]: f["error"] for f in results["files"] if f["status"] == "failed"}
+    assert "exceeds maximum allowed size" in failed["too-big.txt"]
+    assert "Permission denied" in failed["unreadable.txt"]
+    
+    # Without a precomputed hash the per-file path does its own duplicate check
+    fallback_calls = [
+        call.kwargs for call in process_single_file.await_args_list
+        if call.kwargs["file_path"].name != "ok.txt"
+    ]
+    assert len(fallback_calls) == 2
+    assert all(kw["precomputed_hash"] is None and kw["check_duplicate"] for kw in fallback_calls)
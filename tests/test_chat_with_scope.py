@@ -90,6 +90,8 @@ async def test_documents(test_db: AsyncSession, test_user):
     await test_db.commit()
     for doc in docs:
         await test_db.refresh(doc)
+        # full_text is deferred; load it here rather than lazily outside the session
+        await test_db.refresh(doc, ["full_text"])
     
     yield docs
     
@@ -0,0 +1,100 @@
+"""
+Unit tests for DocumentChunk bulk ingestion helpers
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.crud.document_chunk import (
+    _COPY_COLUMNS,
+    _copy_chunks,
+    _copy_field,
+    build_chunk_rows,
+)
+
+
+class TestBuildChunkRows:
+    """Test splitting extracted text into chunk rows"""
+
+    def test_packs_paragraphs(self):
+        """Short paragraphs share a chunk; offsets point back into the text"""
+        text = "aaaaa\n\nbbb\n\n\n\n" + "c" * 25
+        rows = build_chunk_rows(7, text, chunk_size=10)
+
+        assert [row["content"] for row in rows] == ["aaaaa\n\nbbb", "c" * 10, "c" * 10, "c" * 5]
+        assert [row["chunk_index"] for row in rows] == [0, 1, 2, 3]
+        assert all(row["document_id"] == 7 for row in rows)
+        assert all(text[row["start_char"]:row["end_char"]] == row["content"] for row in rows)
+
+    @pytest.mark.parametrize("text", ["", "\n\n  \n\n"])
+    def test_blank_text(self, text):
+        """Text without content produces no chunks"""
+        assert build_chunk_rows(1, text) == []
+
+
+class TestCopyField:
+    """Test COPY text-format encoding of single values"""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("col1\tcol2", "col1\\tcol2"),
+        ("line1\nline2", "line1\\nline2"),
+        ("line1\r\nline2", "line1\\r\\nline2"),
+        ("C:\\temp\\file", "C:\\\\temp\\\\file"),
+        # The backslash is escaped first, so an escape sequence is not doubled up
+        ("\\n\t", "\\\\n\\t"),
+        ("plain text", "plain text"),
+    ])
+    def test_escapes_text(self, value, expected):
+        """Tabs, newlines and backslashes are escaped"""
+        assert _copy_field(value) == expected
+
+    def test_null(self):
+        """None becomes the COPY NULL marker"""
+        assert _copy_field(None) == "\\N"
+
+    def test_literal_null_marker_is_text(self):
+        """A string that looks like the NULL marker stays a string"""
+        assert _copy_field("\\N") == "\\\\N"
+
+    @pytest.mark.parametrize("value", [[0.5, -1.0, 2.0], (0.5, -1.0, 2.0)])
+    def test_vector(self, value):
+        """Lists and tuples use the pgvector text form"""
+        assert _copy_field(value) == "[0.5,-1.0,2.0]"
+
+    def test_numpy_vector(self):
+        """Array-likes with tolist() use the pgvector text form"""
+        np = pytest.importorskip("numpy")
+
+        assert _copy_field(np.array([1, 2.5], dtype=np.float32)) == "[1.0,2.5]"
+
+    def test_bytes(self):
+        """Binary values use bytea hex input with an escaped backslash"""
+        assert _copy_field(b"\x00\xff") == "\\\\x00ff"
+
+    def test_numbers(self):
+        """Other values are written with str()"""
+        assert _copy_field(42) == "42"
+
+
+class TestCopyChunks:
+    """Test the asyncpg COPY path"""
+
+    async def test_registers_vector_codec_once_per_connection(self):
+        """The pgvector codec is registered on first use, not on every COPY"""
+        driver_connection = MagicMock()
+        driver_connection.copy_records_to_table = AsyncMock()
+        raw = MagicMock(driver_connection=driver_connection)
+        conn = MagicMock(info={})
+        conn.get_raw_connection = AsyncMock(return_value=raw)
+        db = MagicMock()
+        db.connection = AsyncMock(return_value=conn)
+        rows = [{"document_id": 1, "chunk_index": i, "content": "text"} for i in range(2)]
+
+        with patch("pgvector.asyncpg.register_vector", new_callable=AsyncMock) as register_vector:
+            await _copy_chunks(db, rows)
+            await _copy_chunks(db, rows)
+
+        register_vector.assert_awaited_once_with(driver_connection)
+        assert driver_connection.copy_records_to_table.await_count == 2
+        records = driver_connection.copy_records_to_table.await_args.kwargs["records"]
+        assert records[1] == (1, 1, "text") + (None,) * (len(_COPY_COLUMNS) - 3)